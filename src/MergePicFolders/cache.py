@@ -0,0 +1,258 @@
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+DEFAULT_PREVIEW_DB_PATH = Path.home() / ".mergepicfolders" / "thumbs.sqlite"
+# Stay well below SQLite's default limit on host parameters per statement
+LOOKUP_BATCH_SIZE = 500
+# Total size of stored thumbnail data before least recently used rows are evicted
+THUMBNAIL_BYTES_LIMIT = 64 * 1024 * 1024
+# Lookups record use in memory; it is written out at most this often (seconds)
+USAGE_FLUSH_INTERVAL = 5.0
+
+
+class PreviewCache:
+    """
+    Persistent mapping from folder path to its preview image and thumbnail.
+
+    Each row records the folder's and the image's modification times when the
+    preview was found, so a folder whose direct contents changed since then,
+    or whose preview image was edited or removed, is treated as a miss and
+    searched again. Rows may also hold the encoded thumbnail, so a hit can be
+    shown without decoding the original image. Thumbnail data is kept under
+    THUMBNAIL_BYTES_LIMIT by evicting the least recently used rows. Lookups
+    only note the use in memory; it is written together with other pending
+    uses every USAGE_FLUSH_INTERVAL seconds, before an eviction and on close,
+    so a hit does not cost a write transaction.
+
+    The cache is only an optimization: if the database cannot be opened or
+    written, lookups return nothing and stores are ignored.
+
+    The underlying sqlite connection is not shared between threads, so an
+    instance must only be used from the thread that created it.
+    """
+
+    def __init__(self, db_path=None, bytes_limit=THUMBNAIL_BYTES_LIMIT):
+        """
+        Open (and create if needed) the preview database.
+
+        Args:
+            db_path (str or Path, optional): Location of the sqlite file.
+                Defaults to ~/.mergepicfolders/thumbs.sqlite.
+            bytes_limit (int, optional): Budget for stored thumbnail data.
+        """
+        self.db_path = Path(db_path) if db_path else DEFAULT_PREVIEW_DB_PATH
+        self.bytes_limit = bytes_limit
+        self._conn = None
+        # Running total of stored thumbnail bytes, so stores need no SUM query
+        self._thumbnail_bytes = 0
+        self._pending_usage = {}  # folder -> last_used not yet written
+        self._last_usage_flush = time.monotonic()
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path))
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS folder_preview("
+                "folder TEXT PRIMARY KEY, image TEXT, folder_mtime_ns INTEGER, "
+                "image_mtime_ns INTEGER, thumbnail BLOB, "
+                "thumbnail_bytes INTEGER NOT NULL DEFAULT 0, last_used INTEGER)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS folder_preview_last_used "
+                "ON folder_preview(last_used)"
+            )
+            conn.commit()
+            (self._thumbnail_bytes,) = conn.execute(
+                "SELECT COALESCE(SUM(thumbnail_bytes), 0) FROM folder_preview"
+            ).fetchone()
+            self._conn = conn
+        except (OSError, sqlite3.Error):
+            self._conn = None
+
+    @property
+    def available(self):
+        """bool: Whether the database was opened successfully."""
+        return self._conn is not None
+
+    def lookup_many(self, folder_paths):
+        """
+        Return the still-valid cached previews for a list of folders.
+
+        A row is valid only if the folder's and the image's current
+        modification times match the stored ones. Valid rows are marked as
+        recently used; the mark is written by the next usage flush.
+
+        Args:
+            folder_paths (list): Folder path strings to look up.
+
+        Returns:
+            dict: Maps each folder with a valid entry to an (image path, image
+                st_mtime_ns, thumbnail bytes) tuple. The thumbnail is None if
+                none was stored.
+        """
+        if self._conn is None or not folder_paths:
+            return {}
+
+        rows = []
+        try:
+            for start in range(0, len(folder_paths), LOOKUP_BATCH_SIZE):
+                batch = folder_paths[start:start + LOOKUP_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows.extend(
+                    self._conn.execute(
+                        "SELECT folder, image, folder_mtime_ns, image_mtime_ns, "
+                        f"thumbnail FROM folder_preview WHERE folder IN ({placeholders})",
+                        batch,
+                    )
+                )
+        except sqlite3.Error:
+            return {}
+
+        previews = {}
+        for folder, image, folder_mtime_ns, image_mtime_ns, thumbnail in rows:
+            try:
+                if os.stat(folder).st_mtime_ns != folder_mtime_ns:
+                    continue
+                if os.stat(image).st_mtime_ns != image_mtime_ns:
+                    continue
+            except OSError:
+                continue
+            previews[folder] = (image, image_mtime_ns, thumbnail)
+
+        if previews:
+            now = time.time_ns()
+            for folder in previews:
+                self._pending_usage[folder] = now
+            if time.monotonic() - self._last_usage_flush >= USAGE_FLUSH_INTERVAL:
+                try:
+                    self._write_pending_usage()
+                    self._conn.commit()
+                except sqlite3.Error:
+                    self._rollback()
+        return previews
+
+    def _write_pending_usage(self):
+        """Write the last_used times noted by lookups, without committing."""
+        self._last_usage_flush = time.monotonic()
+        if not self._pending_usage:
+            return
+        pending = self._pending_usage
+        self._pending_usage = {}
+        self._conn.executemany(
+            "UPDATE folder_preview SET last_used = ? WHERE folder = ?",
+            [(last_used, folder) for folder, last_used in pending.items()],
+        )
+
+    def store(self, folder_path, image_path, thumbnail=None):
+        """
+        Record the preview image found for a folder.
+
+        Args:
+            folder_path (str): The folder the preview belongs to.
+            image_path (str): The image chosen as its preview.
+            thumbnail (bytes, optional): The encoded thumbnail shown for it.
+        """
+        if self._conn is None:
+            return
+        try:
+            folder_mtime_ns = os.stat(folder_path).st_mtime_ns
+            image_mtime_ns = os.stat(image_path).st_mtime_ns
+            thumbnail_bytes = len(thumbnail) if thumbnail else 0
+            replaced = self._conn.execute(
+                "SELECT thumbnail_bytes FROM folder_preview WHERE folder = ?",
+                (folder_path,),
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO folder_preview(folder, image, folder_mtime_ns, "
+                "image_mtime_ns, thumbnail, thumbnail_bytes, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    folder_path,
+                    image_path,
+                    folder_mtime_ns,
+                    image_mtime_ns,
+                    thumbnail,
+                    thumbnail_bytes,
+                    time.time_ns(),
+                ),
+            )
+            self._thumbnail_bytes += thumbnail_bytes - (replaced[0] if replaced else 0)
+            if self._thumbnail_bytes > self.bytes_limit:
+                self._evict_over_limit()
+            self._conn.commit()
+        except OSError:
+            pass
+        except sqlite3.Error:
+            self._rollback()
+
+    def _evict_over_limit(self):
+        """Drop least recently used rows until thumbnails fit in bytes_limit."""
+        # Rows hit since the last flush must not look older than they are
+        self._write_pending_usage()
+        excess = self._thumbnail_bytes - self.bytes_limit
+        evicted = []
+        rows = self._conn.execute(
+            "SELECT folder, thumbnail_bytes FROM folder_preview "
+            "WHERE thumbnail_bytes > 0 ORDER BY last_used"
+        )
+        for folder, thumbnail_bytes in rows:
+            evicted.append((folder,))
+            excess -= thumbnail_bytes
+            self._thumbnail_bytes -= thumbnail_bytes
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM folder_preview WHERE folder = ?", evicted)
+
+    def _rollback(self):
+        """Undo a failed write and reload the byte total it may have changed."""
+        try:
+            self._conn.rollback()
+            (self._thumbnail_bytes,) = self._conn.execute(
+                "SELECT COALESCE(SUM(thumbnail_bytes), 0) FROM folder_preview"
+            ).fetchone()
+        except sqlite3.Error:
+            pass
+
+    def invalidate(self, folder_path):
+        """
+        Drop the entries for a folder and everything below it.
+
+        Args:
+            folder_path (str): The folder whose entries should be removed.
+        """
+        if self._conn is None:
+            return
+        folder_path = str(folder_path).rstrip("/\\")
+        # Escape LIKE wildcards that may legitimately appear in folder names
+        escaped = (
+            folder_path.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        )
+        where = (
+            "WHERE folder = ? "
+            "OR folder LIKE ? ESCAPE '\\' OR folder LIKE ? ESCAPE '\\'"
+        )
+        params = (folder_path, escaped + "/%", escaped + "\\\\%")
+        try:
+            (removed_bytes,) = self._conn.execute(
+                f"SELECT COALESCE(SUM(thumbnail_bytes), 0) FROM folder_preview {where}",
+                params,
+            ).fetchone()
+            self._conn.execute(f"DELETE FROM folder_preview {where}", params)
+            self._conn.commit()
+            self._thumbnail_bytes -= removed_bytes
+        except sqlite3.Error:
+            self._rollback()
+
+    def close(self):
+        """Write pending usage and close the database connection."""
+        if self._conn is not None:
+            try:
+                self._write_pending_usage()
+                self._conn.commit()
+            except sqlite3.Error:
+                pass
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,117 @@
+import os
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt, Signal
+from PySide6.QtGui import QIcon, QPixmapCache
+
+
+class ImageListModel(QAbstractListModel):
+    """
+    List model over the image paths of the previewed folder.
+
+    Rows are plain path strings; no per-row item or icon objects are created
+    up front. Thumbnails are fetched lazily: the first time the view asks for
+    a row's decoration, thumbnail_needed is emitted for its path and a
+    placeholder is shown. Once the owner has put the decoded thumbnail into
+    QPixmapCache it calls set_thumbnail with the cache key, and the row is
+    repainted. Only rows the view actually paints are ever decoded.
+    """
+
+    thumbnail_needed = Signal(str)  # image_path
+
+    def __init__(self, placeholder_icon=None, parent=None):
+        """
+        Initialize an empty model.
+
+        Args:
+            placeholder_icon (QIcon, optional): Shown while a thumbnail is loading
+                or if it cannot be decoded.
+            parent (QObject, optional): Parent object.
+        """
+        super().__init__(parent)
+        self._paths = []
+        self._row_by_path = {}
+        self._cache_keys = {}
+        self._requested = set()
+        self._placeholder_icon = placeholder_icon
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._paths)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._paths):
+            return None
+        path = self._paths[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return os.path.basename(path)
+        if role == Qt.ItemDataRole.UserRole:
+            return path
+        if role == Qt.ItemDataRole.DecorationRole:
+            cache_key = self._cache_keys.get(path)
+            if cache_key is not None:
+                pixmap = QPixmapCache.find(cache_key)
+                if pixmap is not None:
+                    return QIcon(pixmap)
+                # Evicted from QPixmapCache; ask for it again
+                del self._cache_keys[path]
+            if path not in self._requested:
+                self._requested.add(path)
+                self.thumbnail_needed.emit(path)
+            return self._placeholder_icon
+        return None
+
+    def append_paths(self, paths):
+        """
+        Append a batch of image paths as new rows.
+
+        Args:
+            paths (list): Image path strings to add.
+        """
+        if not paths:
+            return
+        first = len(self._paths)
+        self.beginInsertRows(QModelIndex(), first, first + len(paths) - 1)
+        for row, path in enumerate(paths, first):
+            self._row_by_path[path] = row
+        self._paths.extend(paths)
+        self.endInsertRows()
+
+    def clear(self):
+        """Remove all rows and forget their thumbnails."""
+        self.beginResetModel()
+        self._paths = []
+        self._row_by_path = {}
+        self._cache_keys = {}
+        self._requested = set()
+        self.endResetModel()
+
+    def contains(self, path):
+        """
+        Args:
+            path (str): Image path string.
+
+        Returns:
+            bool: Whether the path is one of the model's rows.
+        """
+        return path in self._row_by_path
+
+    def set_thumbnail(self, path, cache_key):
+        """
+        Record where a row's decoded thumbnail is cached and repaint the row.
+
+        Args:
+            path (str): Image path string.
+            cache_key (str): QPixmapCache key holding the thumbnail.
+
+        Returns:
+            bool: False if the path is no longer in the model.
+        """
+        row = self._row_by_path.get(path)
+        if row is None:
+            return False
+        self._cache_keys[path] = cache_key
+        self._requested.discard(path)
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+        return True
@@ -1,4 +1,5 @@
 import os
+import threading
 import time
 from pathlib import Path
 import re
@@ -11,23 +12,86 @@ from PySide6.QtWidgets import (
     QPushButton,
     QLabel,
     QFileDialog,
+    QListView,
     QListWidget,
     QListWidgetItem,
-    QTextEdit,
+    QPlainTextEdit,
     QMessageBox,
     QSplitter,
     QScrollArea,
     QAbstractItemView,
     QFrame,
+    QStyledItemDelegate,
+)
+from PySide6.QtGui import QIcon, QFont, QImage, QPixmap, QPixmapCache
+from PySide6.QtCore import QBuffer, QEvent, QIODevice, Qt, QSize, QThreadPool, QTimer, Signal, Slot
+from .cache import PreviewCache
+from .models import ImageListModel
+from .worker import (
+    FolderPreviewTask,
+    PreviewSignals,
+    ThumbnailSignals,
+    ThumbnailTask,
+    Worker,
+    read_scaled_image,
 )
-from PySide6.QtGui import QPixmap, QIcon, QFont, QImageReader
-from PySide6.QtCore import Qt, QSize, Slot
-from .worker import Worker  # Assuming you have a Worker class defined in worker.py
 from .utils import natural_sort_key
 
 # --- Configuration ---
 THUMBNAIL_SIZE = QSize(128, 128)
 PREVIEW_AREA_MIN_WIDTH = 400
+FOLDER_THUMBNAIL_SIZE = QSize(64, 64)
+PIXMAP_CACHE_LIMIT_KB = 128 * 1024
+# Subfolder items keep their folder path as a str in this role
+FOLDER_PATH_STR_ROLE = Qt.ItemDataRole.UserRole + 1
+# ...and the path str of the image their current thumbnail was made from
+FOLDER_PREVIEW_IMAGE_ROLE = Qt.ItemDataRole.UserRole + 2
+# A subfolder scan starts only once the selection has been stable this long
+SUBFOLDER_PREVIEW_DEBOUNCE_MS = 150
+# The large preview is rescaled once its area has stopped resizing for this long
+PREVIEW_RESIZE_DEBOUNCE_MS = 80
+# Preview searches are I/O bound; a few threads keep the disk busy without thrashing it
+PREVIEW_POOL_MAX_THREADS = 3
+# Image list thumbnails are decoded and delivered at most this many per task
+THUMBNAIL_BATCH_SIZE = 8
+# Time closing the window waits for stopped workers before hiding itself, and
+# in total for running preview and thumbnail tasks
+CLOSE_POOL_WAIT_MS = 2000
+# The activity log keeps only this many most recent lines
+LOG_MAX_LINES = 2000
+# Log lines arriving within this window are appended to the log together
+LOG_FLUSH_INTERVAL_MS = 50
+class FolderThumbnailDelegate(QStyledItemDelegate):
+    """
+    Item delegate that asks for a folder's thumbnail the first time its row is painted.
+
+    Qt only paints rows inside the viewport, so thumbnails are searched for and
+    decoded for the rows the user actually sees instead of for every subfolder.
+    """
+
+    thumbnail_needed = Signal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._requested = set()
+
+    def paint(self, painter, option, index):
+        folder_path_str = index.data(FOLDER_PATH_STR_ROLE)
+        if folder_path_str is not None:
+            if folder_path_str not in self._requested:
+                self._requested.add(folder_path_str)
+                self.thumbnail_needed.emit(folder_path_str)
+        super().paint(painter, option, index)
+
+    def forget(self, folder_path_str):
+        """Request the folder's thumbnail again the next time its row is painted."""
+        self._requested.discard(folder_path_str)
+
+    def reset(self):
+        """Forget all requests, e.g. after pending previews were cancelled."""
+        self._requested.clear()
+
+
 # --- Main Application Window ---
 class ImageFolderTool(QMainWindow):
     def __init__(self):
@@ -37,18 +101,86 @@ class ImageFolderTool(QMainWindow):
 
         # Initialize state variables (same as before)
         self.current_root_folder = None
-        self.image_files_in_preview = []
         self.worker_thread = None
         self.current_task_type = None
-        self.last_previewed_folder = None
-        self.folder_preview_tasks = {}
-        self.folder_preview_cache = {}
-        self.subfolder_items_cache = {}
-        self.folder_preview_cache_by_name = {}
-        self.waiting_folders = []
+        self._dying_workers = []  # stopped workers that have not exited yet
+        self._close_when_workers_exit = False  # set by a deferred closeEvent
+        self.last_previewed_folder = None  # folder path str of the last image scan
+        self.pending_folder_previews = set()
+        self.subfolder_items_cache = {}  # folder path str -> QListWidgetItem
         self._checked_folder_names_cache = set()
+        self._checked_subfolder_paths = set()  # folder path strs of checked rows
         self.last_merged_sources = []
         self.last_merged_target = None
+        self._pending_subfolder_preview = None
+        # The large preview is kept out of QPixmapCache so a big image cannot
+        # evict the thumbnails: (path, mtime, full pixmap) of the last image
+        # shown, and (path, mtime, width, scaled pixmap) of what is displayed
+        self._large_preview_source = None
+        self._large_preview = None
+
+        self._preview_debounce = QTimer(self)
+        self._preview_debounce.setSingleShot(True)
+        self._preview_debounce.setInterval(SUBFOLDER_PREVIEW_DEBOUNCE_MS)
+        self._preview_debounce.timeout.connect(self._do_pending_subfolder_preview)
+
+        self._preview_resize_debounce = QTimer(self)
+        self._preview_resize_debounce.setSingleShot(True)
+        self._preview_resize_debounce.setInterval(PREVIEW_RESIZE_DEBOUNCE_MS)
+        self._preview_resize_debounce.timeout.connect(self.show_large_preview)
+
+        # Log lines are buffered and appended in one go, so a burst of worker
+        # messages costs one append and one scroll instead of one per line
+        self._pending_log_lines = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+
+        # Looked up once; every subfolder row starts out with this icon
+        self._default_folder_icon = QIcon.fromTheme("folder")
+
+        # Decoded thumbnails are shared application-wide through QPixmapCache
+        QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
+
+        # Previews found in earlier sessions, so a restart doesn't rescan every folder
+        self.preview_store = PreviewCache()
+
+        # Folder previews run as tasks on a shared pool instead of one QThread each
+        self.preview_pool = QThreadPool(self)
+        self.preview_pool.setMaxThreadCount(PREVIEW_POOL_MAX_THREADS)
+        self._preview_cancel_event = threading.Event()
+        # Tasks emit from pool threads; queue every slot onto the GUI thread explicitly
+        queued = Qt.ConnectionType.QueuedConnection
+        self._preview_signals = PreviewSignals()
+        self._preview_signals.folder_preview_image.connect(self.set_folder_thumbnail_image, queued)
+        self._preview_signals.folder_preview_image.connect(self.store_folder_preview, queued)
+        self._preview_signals.progress.connect(self.update_progress, queued)
+        self._preview_signals.error.connect(self.handle_preview_error, queued)
+        self._preview_signals.finished.connect(self.folder_preview_task_finished, queued)
+        # Rows painted in one pass are looked up in the preview store together
+        self._pending_folder_preview_requests = []
+        self._folder_preview_batch_timer = QTimer(self)
+        self._folder_preview_batch_timer.setSingleShot(True)
+        self._folder_preview_batch_timer.setInterval(0)
+        self._folder_preview_batch_timer.timeout.connect(
+            self._request_pending_folder_previews
+        )
+
+        # Image list thumbnails are decoded on their own pool; only QImage crosses
+        # threads and the QPixmap is created in set_image_thumbnails
+        self.thumbnail_pool = QThreadPool(self)
+        self.thumbnail_pool.setMaxThreadCount(max(2, (os.cpu_count() or 1) - 1))
+        self._thumbnail_cancel_event = threading.Event()
+        # Rows painted in one pass are collected and sent to the pool together
+        self._pending_thumbnail_paths = []
+        self._thumbnail_batch_timer = QTimer(self)
+        self._thumbnail_batch_timer.setSingleShot(True)
+        self._thumbnail_batch_timer.setInterval(0)
+        self._thumbnail_batch_timer.timeout.connect(self._start_thumbnail_tasks)
+        self._thumbnail_signals = ThumbnailSignals()
+        self._thumbnail_signals.thumbnails_ready.connect(self.set_image_thumbnails, queued)
+        self._thumbnail_signals.failed.connect(self.handle_thumbnail_failed, queued)
 
         # Create the modern UI
         self.setup_ui()
@@ -155,8 +287,14 @@ class ImageFolderTool(QMainWindow):
         self.subfolder_list_widget.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
         # self.subfolder_list_widget.currentItemChanged.connect(self.trigger_subfolder_preview)
         self.subfolder_list_widget.itemDoubleClicked.connect(self.trigger_subfolder_preview)
-        self.subfolder_list_widget.itemChanged.connect(self.update_merge_button_state)
+        self.subfolder_list_widget.itemChanged.connect(self._on_subfolder_item_changed)
         self.subfolder_list_widget.setIconSize(QSize(96, 96))  # Increased from 64x64
+        # Folder thumbnails are requested lazily, only for rows that get painted
+        self.folder_thumbnail_delegate = FolderThumbnailDelegate(self.subfolder_list_widget)
+        self.folder_thumbnail_delegate.thumbnail_needed.connect(
+            self.request_visible_folder_preview, Qt.ConnectionType.QueuedConnection
+        )
+        self.subfolder_list_widget.setItemDelegate(self.folder_thumbnail_delegate)
         
         left_layout.addWidget(self.subfolder_list_widget, 1)
         
@@ -181,16 +319,24 @@ class ImageFolderTool(QMainWindow):
         image_list_title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
         middle_layout.addWidget(image_list_title)
         
-        # Modern thumbnail view for images
-        self.image_list_widget = QListWidget()
-        self.image_list_widget.setViewMode(QListWidget.ViewMode.IconMode)
-        self.image_list_widget.setIconSize(THUMBNAIL_SIZE)
-        self.image_list_widget.setResizeMode(QListWidget.ResizeMode.Adjust)
-        self.image_list_widget.setSpacing(8)
-        self.image_list_widget.setWordWrap(True)
-        self.image_list_widget.setUniformItemSizes(True)
-        self.image_list_widget.itemSelectionChanged.connect(self.show_large_preview)
-        middle_layout.addWidget(self.image_list_widget, 1)
+        # Modern thumbnail view for images. The model holds plain path strings
+        # and asks for thumbnails only for rows the view paints.
+        self.image_list_model = ImageListModel(QIcon.fromTheme("image-missing"), self)
+        self.image_list_model.thumbnail_needed.connect(
+            self.request_image_thumbnail, Qt.ConnectionType.QueuedConnection
+        )
+        self.image_list_view = QListView()
+        self.image_list_view.setViewMode(QListView.ViewMode.IconMode)
+        self.image_list_view.setIconSize(THUMBNAIL_SIZE)
+        self.image_list_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.image_list_view.setSpacing(8)
+        self.image_list_view.setWordWrap(True)
+        self.image_list_view.setUniformItemSizes(True)
+        self.image_list_view.setModel(self.image_list_model)
+        self.image_list_view.selectionModel().selectionChanged.connect(
+            self.show_large_preview
+        )
+        middle_layout.addWidget(self.image_list_view, 1)
 
         # ==== RIGHT PANEL - Preview ====
         right_panel = QFrame()
@@ -219,11 +365,14 @@ class ImageFolderTool(QMainWindow):
         self.preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.preview_label.setMinimumSize(PREVIEW_AREA_MIN_WIDTH, 250)
         
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setWidget(self.preview_label)
-        scroll_area.setFrameShape(QFrame.Shape.NoFrame)
-        preview_layout.addWidget(scroll_area, 1)
+        # Kept on self so show_large_preview can size previews without a parent walk
+        self.preview_scroll_area = QScrollArea()
+        self.preview_scroll_area.setWidgetResizable(True)
+        self.preview_scroll_area.setWidget(self.preview_label)
+        self.preview_scroll_area.setFrameShape(QFrame.Shape.NoFrame)
+        # Rescale the shown image when the preview area changes width
+        self.preview_scroll_area.viewport().installEventFilter(self)
+        preview_layout.addWidget(self.preview_scroll_area, 1)
         
         right_layout.addWidget(preview_frame, 1)
         
@@ -243,9 +392,11 @@ class ImageFolderTool(QMainWindow):
         log_title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
         main_layout.addWidget(log_title)
         
-        self.log_edit = QTextEdit()
+        # Plain text without rich-text layout; old lines are dropped past the limit
+        self.log_edit = QPlainTextEdit()
         self.log_edit.setObjectName("log_edit")
         self.log_edit.setReadOnly(True)
+        self.log_edit.setMaximumBlockCount(LOG_MAX_LINES)
         self.log_edit.setFont(QFont("Consolas", 9))
         self.log_edit.setFixedHeight(100)
         main_layout.addWidget(self.log_edit)
@@ -307,25 +458,25 @@ class ImageFolderTool(QMainWindow):
             }}
             
             /* List widgets */
-            QListWidget {{
+            QListView {{
                 background-color: {colors["card"]};
                 border-radius: 6px;
                 border: 1px solid {colors["border"]};
                 padding: 2px;
             }}
             
-            QListWidget::item {{
+            QListView::item {{
                 border-radius: 2px;
                 padding: 4px;
                 margin: 2px;
             }}
             
-            QListWidget::item:selected {{
+            QListView::item:selected {{
                 background-color: {colors["primary"]};
                 color: #F8F8F2;
             }}
             
-            QListWidget::item:hover:!selected {{
+            QListView::item:hover:!selected {{
                 background-color: #ecf0f1;
             }}
             
@@ -390,7 +541,7 @@ class ImageFolderTool(QMainWindow):
             }}
             
             /* Log area */
-            QTextEdit#log_edit {{
+            QPlainTextEdit#log_edit {{
                 background-color: #2c3e50;
                 color: #ecf0f1;
                 border-radius: 6px;
@@ -406,14 +557,28 @@ class ImageFolderTool(QMainWindow):
         Args:
             message (str): The message to log. 
             
-        This method appends the message to the log area with a timestamp.
-        It also ensures that the log area scrolls to the bottom to show the latest message.'''
+        The message is timestamped now but only shown by the next _flush_log,
+        at most LOG_FLUSH_INTERVAL_MS later, together with any other lines
+        logged in the meantime.'''
         timestamp = time.strftime("%H:%M:%S")
-        self.log_edit.append(f"[{timestamp}] {message}")
+        self._pending_log_lines.append(f"[{timestamp}] {message}")
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self):
+        '''
+        Append all buffered log lines to the log area at once.
+
+        The log area is scrolled to the bottom to show the latest message.
+        Only the last LOG_MAX_LINES lines are kept.'''
+        if not self._pending_log_lines:
+            return
+        lines = self._pending_log_lines
+        self._pending_log_lines = []
+        self.log_edit.appendPlainText("\n".join(lines[-LOG_MAX_LINES:]))
         self.log_edit.verticalScrollBar().setValue(
             self.log_edit.verticalScrollBar().maximum()
         )
-        QApplication.processEvents()
 
     @Slot(str)
     def update_progress(self, message):
@@ -437,6 +602,9 @@ class ImageFolderTool(QMainWindow):
         This method logs the error message and shows a critical error dialog to the user.
         It also stops the current worker thread if it exists.
         '''
+        if self._is_stale_worker_signal():
+            self.log_message(f"Ignored error from a cancelled task: {error_message}")
+            return
         self.log_message(f"ERROR: {error_message}")
         QMessageBox.critical(self, "Error", error_message)
         if self.worker_thread:
@@ -458,98 +626,104 @@ class ImageFolderTool(QMainWindow):
             f"Task '{task_type}' finished {'successfully' if success else 'with errors/cancellation'}."
         )
         original_worker = self.sender()
+        if original_worker in self._dying_workers:
+            # A stopped worker winding down; its results are stale and the UI
+            # was already re-enabled when it was stopped. finished is the last
+            # signal a worker emits, so it can be released now; run() is already
+            # returning, so the wait is only for the thread to exit.
+            self._dying_workers.remove(original_worker)
+            original_worker.wait()
+            if self._close_when_workers_exit and not self._dying_workers:
+                QTimer.singleShot(0, self.close)
+            return
+        if self._is_stale_worker_signal():
+            return
         if self.worker_thread == original_worker:
             self.worker_thread = None
             self.current_task_type = None
+            # The QThread must not be destroyed before run() has returned
+            original_worker.wait()
             # Enable UI only after potential list update
 
         if task_type == "merge_subs":
             self.log_message("Updating subfolder list after merge...")
             self.clear_preview_area()  # Still clear the image preview
 
-            # --- Temporarily disconnect signal ---
+            # Block list signals while rows are removed, added and resorted so
+            # the intermediate states don't fire itemChanged/currentItemChanged,
+            # and hold off painting until the list has reached its final order.
+            self.subfolder_list_widget.blockSignals(True)
+            self.subfolder_list_widget.setUpdatesEnabled(False)
             try:
-                self.subfolder_list_widget.itemDoubleClicked.disconnect(
-                    self.trigger_subfolder_preview
-                )
-            except RuntimeError as e:  # Already disconnected or never connected
-                self.log_message(f"Note: Signal disconnect failed ({e})")
-            # ------------------------------------
-
-            if success and self.last_merged_target and self.last_merged_sources:
-                # Remove source items
-                items_to_remove = []
-                source_paths_set = set(self.last_merged_sources)
-                for index in range(self.subfolder_list_widget.count()):
-                    item = self.subfolder_list_widget.item(index)
-                    if item:
-                        item_data = item.data(Qt.ItemDataRole.UserRole)
-                        if item_data in source_paths_set:
-                            items_to_remove.append(item)
-
-                for item in items_to_remove:
-                    row = self.subfolder_list_widget.row(item)
-                    self.subfolder_list_widget.takeItem(row)
-                    # Also remove from thumbnail cache if present
-                    folder_path_str = str(item.data(Qt.ItemDataRole.UserRole))
-                    if folder_path_str in self.folder_preview_cache:
-                        del self.folder_preview_cache[folder_path_str]
-                        self.folder_preview_cache_by_name.pop(Path(folder_path_str).name, None)
-                    if folder_path_str in self.folder_preview_tasks:
-                        # Stop any preview task for the removed folder
-                        preview_worker = self.folder_preview_tasks.pop(folder_path_str)
-                        if preview_worker and preview_worker.isRunning():
-                            preview_worker.stop()
-                    if folder_path_str in getattr(self, 'subfolder_items_cache', {}):
-                        del self.subfolder_items_cache[folder_path_str]
-
-                # Add target item (if it's directly under the root)
-                if self.last_merged_target.parent == self.current_root_folder:
-                    target_item = QListWidgetItem(self.last_merged_target.name)
-                    target_item.setData(
-                        Qt.ItemDataRole.UserRole, self.last_merged_target
+                # Merged folders changed on disk, so their stored previews are stale
+                for source_path in self.last_merged_sources:
+                    self.preview_store.invalidate(str(source_path))
+                if self.last_merged_target:
+                    self.preview_store.invalidate(str(self.last_merged_target))
+
+                if success and self.last_merged_target and self.last_merged_sources:
+                    # Remove source items, found through the path index. Rows are
+                    # taken from the bottom up so earlier removals don't shift the
+                    # rows still to be taken.
+                    rows_to_remove = []
+                    for source_path in self.last_merged_sources:
+                        item = self.subfolder_items_cache.get(str(source_path))
+                        if item is not None:
+                            rows_to_remove.append(
+                                (self.subfolder_list_widget.row(item), item)
+                            )
+                    rows_to_remove.sort(key=lambda pair: pair[0], reverse=True)
+
+                    for row, item in rows_to_remove:
+                        if row >= 0:
+                            self.subfolder_list_widget.takeItem(row)
+                        # Its cached thumbnail is keyed by a preview image that
+                        # has been moved away, so it is never found again
+                        folder_path_str = item.data(FOLDER_PATH_STR_ROLE)
+                        self.pending_folder_previews.discard(folder_path_str)
+                        self.subfolder_items_cache.pop(folder_path_str, None)
+                        self._checked_subfolder_paths.discard(folder_path_str)
+
+                    # Add target item (if it's directly under the root)
+                    if self.last_merged_target.parent == self.current_root_folder:
+                        target_path_str = str(self.last_merged_target)
+                        target_item = self._create_subfolder_item(
+                            target_path_str, checked=False
+                        )
+                        self.subfolder_list_widget.addItem(target_item)
+                        self.subfolder_items_cache[target_path_str] = target_item
+                        # The new item has no preview image yet, so no stale
+                        # thumbnail is used; the delegate will request a new
+                        # one when the row is painted
+                        self.folder_thumbnail_delegate.forget(target_path_str)
+
+                    # Sort the list according to current sort mode instead of default
+                    self.sort_subfolder_list()  # This modifies the list heavily
+
+                    self.log_message("Subfolder list updated.")
+                elif not success:
+                    self.log_message(
+                        "Merge failed or cancelled. List not updated, consider refreshing manually if needed."
                     )
-                    target_item.setIcon(QIcon.fromTheme("folder"))
-                    target_item.setFlags(
-                        target_item.flags() | Qt.ItemFlag.ItemIsUserCheckable
+                else:
+                    self.log_message(
+                        "Merge completed but source/target info missing. Refreshing list fully."
                     )
-                    target_item.setCheckState(Qt.CheckState.Unchecked)
-                    self.subfolder_list_widget.addItem(target_item)
-                    if hasattr(self, 'subfolder_items_cache'):
-                        self.subfolder_items_cache[str(self.last_merged_target)] = target_item
-                    # Optionally request its thumbnail immediately
-                    self.request_folder_preview(self.last_merged_target, target_item)
-
-                # Sort the list according to current sort mode instead of default
-                self.sort_subfolder_list()  # This modifies the list heavily
-
-                self.log_message("Subfolder list updated.")
-            elif not success:
-                self.log_message(
-                    "Merge failed or cancelled. List not updated, consider refreshing manually if needed."
-                )
-            else:
-                self.log_message(
-                    "Merge completed but source/target info missing. Refreshing list fully."
-                )
-                self.populate_subfolder_list()  # Fallback to full refresh
+                    self.populate_subfolder_list()  # Fallback to full refresh
+            finally:
+                self.subfolder_list_widget.setUpdatesEnabled(True)
+                self.subfolder_list_widget.blockSignals(False)
 
             # Clear the stored paths
             self.last_merged_sources = []
             self.last_merged_target = None
             self.update_merge_button_state()  # Update button state
 
-            # --- Reconnect signal ---
-            self.subfolder_list_widget.itemDoubleClicked.connect(
-                self.trigger_subfolder_preview
-            )
-            # ------------------------
-
         elif task_type == "scan_subfolder_images":
             if success:
-                count = self.image_list_widget.count()
+                count = self.image_list_model.rowCount()
                 folder_name = (
-                    self.last_previewed_folder.name
+                    os.path.basename(self.last_previewed_folder)
                     if self.last_previewed_folder
                     else "selected folder"
                 )
@@ -558,7 +732,7 @@ class ImageFolderTool(QMainWindow):
                 )
             else:
                 self.image_path_label.setText(
-                    f"Error scanning '{self.last_previewed_folder.name if self.last_previewed_folder else 'folder'}'."
+                    f"Error scanning '{os.path.basename(self.last_previewed_folder) if self.last_previewed_folder else 'folder'}'."
                 )
         elif task_type == "populate_subfolders":
             if not success:
@@ -587,7 +761,7 @@ class ImageFolderTool(QMainWindow):
             self.update_merge_button_state()
         else:
             self.merge_button.setEnabled(False)
-        self.image_list_widget.setEnabled(enabled)
+        self.image_list_view.setEnabled(enabled)
         self.subfolder_list_widget.setDisabled(not enabled)
 
     @Slot()
@@ -598,7 +772,10 @@ class ImageFolderTool(QMainWindow):
         and resets the state variables before allowing the user to select a new folder.
         '''
         
+        # Stop outstanding work before the modal dialog so it doesn't keep
+        # scanning the old tree while the user picks a new one
         self.stop_worker_thread()
+        self.cancel_folder_previews()
 
         folder = QFileDialog.getExistingDirectory(
             self, "Select Root Folder Containing Subfolders"
@@ -613,11 +790,8 @@ class ImageFolderTool(QMainWindow):
             self.clear_preview_area()
             self.merge_button.setEnabled(False)
             self.last_previewed_folder = None
-            self.folder_preview_cache.clear()
-            self.folder_preview_cache_by_name.clear()
-            self.folder_preview_tasks.clear()
-            self.waiting_folders.clear()
             self._checked_folder_names_cache.clear()
+            self._checked_subfolder_paths.clear()
 
             self.populate_subfolder_list()
 
@@ -635,22 +809,17 @@ class ImageFolderTool(QMainWindow):
 
         self.stop_worker_thread()
 
-        self._checked_folder_names_cache = set()
-        for index in range(self.subfolder_list_widget.count()):
-            item = self.subfolder_list_widget.item(index)
-            if item and item.checkState() == Qt.CheckState.Checked:
-                self._checked_folder_names_cache.add(item.text())
+        self._checked_folder_names_cache = {
+            os.path.basename(path) for path in self._checked_subfolder_paths
+        }
 
         self.subfolder_list_widget.clear()
         self.subfolder_items_cache.clear()
+        self._checked_subfolder_paths.clear()
         self.log_message("Starting subfolder population task...")
         self.enable_ui(False)
 
-        for worker in self.folder_preview_tasks.values():
-            if worker and worker.isRunning():
-                worker.stop()
-        self.folder_preview_tasks.clear()
-        self.waiting_folders.clear()
+        self.cancel_folder_previews()
 
         self.current_task_type = "populate_subfolders"
         self.worker_thread = Worker(
@@ -668,11 +837,13 @@ class ImageFolderTool(QMainWindow):
         '''
         Handle the subfolders found by the worker thread.
         Args:
-            subdirs (list): List of subdirectories found by the worker.
+            subdirs (list): Path strings of the subdirectories found by the worker.
         This method populates the subfolder list widget with the found subdirectories,
         sets their icons, and manages the thumbnail caching.
         It also handles the sorting of the subfolders based on the current sort mode.
         '''
+        if self._is_stale_worker_signal():
+            return
         self.log_message(f"Received {len(subdirs)} subfolders from worker.")
 
         if not subdirs:
@@ -680,224 +851,494 @@ class ImageFolderTool(QMainWindow):
             return
 
         count = 0
-        folders_needing_thumbnails = []
+        # Apply check states without firing itemChanged once per row; the
+        # merge button is refreshed once in the finally block instead. Painting
+        # is suspended too, so the list is laid out once after the last row.
+        signals_were_blocked = self.subfolder_list_widget.blockSignals(True)
+        self.subfolder_list_widget.setUpdatesEnabled(False)
         try:
             # Sort subdirs based on current sort mode
+            named_subdirs = [(os.path.basename(subdir), subdir) for subdir in subdirs]
             if self.use_natural_sort:
-                subdirs.sort(key=lambda p: self._natural_sort_key(p.name))
+                named_subdirs.sort(key=lambda pair: self._natural_sort_key(pair[0]))
             else:
-                subdirs.sort(key=lambda p: p.name)
+                named_subdirs.sort(key=lambda pair: pair[0])
                 
-            for subdir in subdirs:
-                item = QListWidgetItem(subdir.name)
-                item.setData(Qt.ItemDataRole.UserRole, subdir)
-                item.setIcon(QIcon.fromTheme("folder"))
-                item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-                if subdir.name in self._checked_folder_names_cache:
-                    item.setCheckState(Qt.CheckState.Checked)
-                else:
-                    item.setCheckState(Qt.CheckState.Unchecked)
+            for name, subdir_str in named_subdirs:
+                checked = name in self._checked_folder_names_cache
+                item = self._create_subfolder_item(subdir_str, checked, name)
+                if checked:
+                    # itemChanged is blocked here, so track the check directly
+                    self._checked_subfolder_paths.add(subdir_str)
                 self.subfolder_list_widget.addItem(item)
-                self.subfolder_items_cache[str(subdir)] = item
+                self.subfolder_items_cache[subdir_str] = item
                 count += 1
 
-                folder_path_str = str(subdir)
-                if subdir.name in self.folder_preview_cache_by_name:
-                    cached_image_path = self.folder_preview_cache_by_name[subdir.name]
-                    if os.path.isfile(cached_image_path) and os.access(
-                        cached_image_path, os.R_OK
-                    ):
-                        self.folder_preview_cache[folder_path_str] = cached_image_path
-                        self.set_folder_thumbnail(folder_path_str, cached_image_path)
-                    else:
-                        folders_needing_thumbnails.append((subdir, item))
-                        if folder_path_str in self.folder_preview_cache:
-                            del self.folder_preview_cache[folder_path_str]
-                        self.folder_preview_cache_by_name.pop(subdir.name, None)
-                else:
-                    folders_needing_thumbnails.append((subdir, item))
-
-            max_initial_workers = 2
-            active_workers = 0
-
-            for i in range(min(max_initial_workers, len(folders_needing_thumbnails))):
-                folder_path, item = folders_needing_thumbnails[i]
-                self.request_folder_preview(folder_path, item)
-                active_workers += 1
-
-            for i in range(max_initial_workers, len(folders_needing_thumbnails)):
-                folder_path, item = folders_needing_thumbnails[i]
-                self.waiting_folders.append((folder_path, item))
-
             self.log_message(
-                f"Populated list with {count} subfolders. Requesting thumbnails..."
+                f"Populated list with {count} subfolders. Thumbnails load as rows are shown."
             )
 
         except Exception as e:
             self.handle_error(f"Error populating subfolder list widget: {e}")
         finally:
+            self.subfolder_list_widget.setUpdatesEnabled(True)
+            self.subfolder_list_widget.blockSignals(signals_were_blocked)
             self.update_merge_button_state()
 
-    @Slot(str, bool)
-    def folder_preview_task_finished(self, task_type, success):
+    def _create_subfolder_item(self, folder_path_str, checked, name=None):
         """
-        Handle the completion of a folder preview generation task.
-        
-        This slot is connected to the 'finished' signal of Worker objects created for folder preview
-        tasks. When a folder preview task completes, this method removes it from the tracking
-        dictionary and starts the next waiting task from the queue if available.
-        
+        Create a checkable subfolder list item.
+
+        Only the path string is stored on the item; a Path is built from it
+        where one is actually needed (scanning or merging the folder).
+
         Args:
-            task_type (str): The type of task that finished, should be "get_folder_preview".
-            success (bool): Whether the task completed successfully or not.
-            
-        Note:
-            This method is automatically called by the Qt signal-slot system when a Worker
-            object emits its 'finished' signal. It identifies which worker emitted the signal
-            using self.sender() and manages the task queue accordingly.
-            
+            folder_path_str (str): The folder the item represents
+            checked (bool): Initial check state
+            name (str, optional): The folder's name, if the caller already has it
+
+        Returns:
+            QListWidgetItem: The new item, not yet added to the list
+        """
+        if name is None:
+            name = os.path.basename(folder_path_str)
+        item = QListWidgetItem(name)
+        item.setData(FOLDER_PATH_STR_ROLE, folder_path_str)
+        item.setIcon(self._default_folder_icon)
+        item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+        item.setCheckState(
+            Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+        )
+        return item
+
+    @Slot(str)
+    def folder_preview_task_finished(self, folder_path_str):
+        """
+        Handle the completion of a folder preview task.
+
+        This slot is connected to the shared preview signals and is called once
+        for every FolderPreviewTask, whether or not it found an image.
+
+        Args:
+            folder_path_str (str): The folder the finished task was searching.
+
         Side effects:
-            - Removes the completed task from self.folder_preview_tasks
-            - May start a new folder preview task from self.waiting_folders queue
+            - Removes the folder from self.pending_folder_previews
         """
-        if task_type != "get_folder_preview":
-            return
+        self.pending_folder_previews.discard(folder_path_str)
 
-        worker = self.sender()
+    @Slot(str, str, QImage)
+    def store_folder_preview(self, folder_path_str, image_path_str, thumbnail_image):
+        """
+        Persist a preview found by a FolderPreviewTask.
+
+        Args:
+            folder_path_str (str): The folder that was searched.
+            image_path_str (str): The image found as its preview.
+            thumbnail_image (QImage): The thumbnail decoded by the task.
 
-        for folder_path, w in list(self.folder_preview_tasks.items()):
-            if w == worker:
-                del self.folder_preview_tasks[folder_path]
-                break
+        Side effects:
+            - Writes the entry to self.preview_store
+        """
+        thumbnail = self._encode_thumbnail(thumbnail_image)
+        self.preview_store.store(folder_path_str, image_path_str, thumbnail)
+
+    def _encode_thumbnail(self, image):
+        """
+        Encode a folder thumbnail for the persistent preview store.
 
-        if self.waiting_folders:
-            next_folder, next_item = self.waiting_folders.pop(0)
-            self.request_folder_preview(next_folder, next_item)
+        Args:
+            image (QImage or QPixmap): The decoded thumbnail
 
-    def request_folder_preview(self, folder_path, list_item):
+        Returns:
+            bytes: PNG data if the image has transparency, JPEG otherwise,
+                or None if encoding failed
         """
-        Request a thumbnail preview generation for a specific folder.
-        
-        This method manages the creation and execution of worker threads that generate
-        thumbnail previews for folders. It implements a throttling mechanism to limit
-        the number of concurrent preview tasks and maintains a queue of waiting folders.
-        
-        If a preview for the folder already exists in the cache, it uses the cached preview
-        instead of starting a new task. Otherwise, it either starts a new worker thread or
-        adds the folder to the waiting queue if the maximum number of concurrent workers
-        has been reached.
-        
+        buffer = QBuffer()
+        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+        image_format = "PNG" if image.hasAlphaChannel() else "JPEG"
+        if not image.save(buffer, image_format):
+            return None
+        return bytes(buffer.data())
+
+    @Slot(str)
+    def handle_preview_error(self, error_message):
+        """
+        Log an error reported by a folder preview task.
+
+        Preview failures only affect a single thumbnail, so unlike handle_error
+        this does not show a dialog or touch the main worker state.
+
+        Args:
+            error_message (str): The error message to log.
+        """
+        self.log_message(f"ERROR: {error_message}")
+
+    @Slot(str)
+    def request_visible_folder_preview(self, folder_path_str):
+        """
+        Request the thumbnail of a subfolder row that has just been painted.
+
+        Connected (queued) to FolderThumbnailDelegate.thumbnail_needed, so the
+        list is never modified from inside a paint event. Rows painted in one
+        pass are collected and handled together by request_folder_previews
+        once control returns to the event loop.
+
         Args:
-            folder_path (Path): Path object representing the folder to generate a preview for
-            list_item (QListWidgetItem): The list widget item associated with this folder,
-                                         which will display the thumbnail when ready
-                                         
+            folder_path_str (str): The folder shown by the painted row.
+        """
+        self._pending_folder_preview_requests.append(folder_path_str)
+        self._folder_preview_batch_timer.start()
+
+    @Slot()
+    def _request_pending_folder_previews(self):
+        """Hand the rows collected by request_visible_folder_preview over in one batch."""
+        folder_path_strs = self._pending_folder_preview_requests
+        self._pending_folder_preview_requests = []
+        self.request_folder_previews(folder_path_strs)
+
+    def request_folder_previews(self, folder_path_strs):
+        """
+        Request thumbnail previews for a batch of subfolder rows.
+
+        A folder's thumbnail is taken from QPixmapCache if it was shown before.
+        Its cache key includes the preview image and that image's mtime, which
+        the item remembers once an icon was set, and which the persistent
+        preview store provides for rows rebuilt by a repopulate. All folders
+        the item alone cannot answer are looked up in the store with a single
+        query; a hit's stored thumbnail, or else its stored image path, is
+        decoded. Only if both miss is a FolderPreviewTask queued on the preview
+        thread pool, which limits how many run at once.
+
+        Args:
+            folder_path_strs (list): Folder path strings of the rows to show
+
         Side effects:
-            - May add entries to self.folder_preview_tasks dictionary
-            - May add entries to self.waiting_folders list
-            - May start a Worker thread to generate the preview
-            - May update the icon of the provided list_item if a cached preview exists
-            
+            - May add entries to self.pending_folder_previews
+            - May queue FolderPreviewTasks on self.preview_pool
+            - May update the icons of the folders' list items
+            - May query self.preview_store
+
         Raises:
             Various exceptions may be caught and logged, but not propagated
         """
         try:
-            if not folder_path or not list_item or not folder_path.is_dir():
-                return
-
-            folder_path_str = str(folder_path)
-            if folder_path_str in self.folder_preview_cache:
-                cached_path = self.folder_preview_cache[folder_path_str]
-                if Path(cached_path).exists() and os.access(cached_path, os.R_OK):
-                    self.set_folder_thumbnail(folder_path_str, cached_path)
-                    return
-
-            if folder_path_str in self.folder_preview_tasks:
-                # Skip if a preview task is already running for this folder
-                return
-            max_workers = 2
-            if len(self.folder_preview_tasks) >= max_workers:
-                self.waiting_folders.append((folder_path, list_item))
-                return
+            # No is_dir() stat here: a cache hit needs no disk access, and
+            # FolderPreviewTask reports folders that have gone away
+            to_look_up = []
+            for folder_path_str in dict.fromkeys(folder_path_strs):
+                list_item = self.subfolder_items_cache.get(folder_path_str)
+                if list_item is None:
+                    continue  # The folder left the list before the request ran
+                preview_image = list_item.data(FOLDER_PREVIEW_IMAGE_ROLE)
+                if preview_image:
+                    try:
+                        image_mtime_ns = os.stat(preview_image).st_mtime_ns
+                    except OSError:
+                        image_mtime_ns = None  # The preview image is gone; look again
+                    if image_mtime_ns is not None and self._show_cached_folder_thumbnail(
+                        folder_path_str, preview_image, image_mtime_ns, list_item
+                    ):
+                        continue
+                to_look_up.append((folder_path_str, list_item))
 
-            worker = Worker(
-                task_type="get_folder_preview", folder_to_scan=folder_path_str
+            stored_previews = self.preview_store.lookup_many(
+                [folder_path_str for folder_path_str, _ in to_look_up]
             )
-            worker.progress.connect(self.update_progress)
-            worker.error.connect(self.handle_error)
-            worker.folder_preview_image.connect(self.set_folder_thumbnail)
-            worker.finished.connect(self.folder_preview_task_finished)
-
-            self.folder_preview_tasks[folder_path_str] = worker
-            worker.start()
+            for folder_path_str, list_item in to_look_up:
+                stored = stored_previews.get(folder_path_str)
+                if stored is not None and self._show_stored_folder_thumbnail(
+                    folder_path_str, list_item, stored
+                ):
+                    continue
+
+                if folder_path_str in self.pending_folder_previews:
+                    # Skip if a preview task is already queued for this folder
+                    continue
+
+                self.pending_folder_previews.add(folder_path_str)
+                self.preview_pool.start(
+                    FolderPreviewTask(
+                        folder_path_str,
+                        FOLDER_THUMBNAIL_SIZE,
+                        self._preview_signals,
+                        self._preview_cancel_event,
+                    )
+                )
         except Exception as e:
             self.log_message(f"Error requesting folder preview: {e}")
 
-    @Slot(str, str)
+    def _show_stored_folder_thumbnail(self, folder_path_str, list_item, stored):
+        """
+        Show a folder's thumbnail from a valid persistent preview store entry.
+
+        Args:
+            folder_path_str (str): The folder the entry belongs to
+            list_item (QListWidgetItem): The folder's list item
+            stored (tuple): (image path, image st_mtime_ns, thumbnail bytes or
+                None) as returned by PreviewCache.lookup_many
+
+        Returns:
+            bool: True if a thumbnail was set
+        """
+        stored_image, stored_mtime_ns, stored_thumbnail = stored
+        # Rows rebuilt by a repopulate don't know their preview image yet; the
+        # store does, so an icon still in QPixmapCache is reused instead of
+        # decoding the stored thumbnail again
+        if self._show_cached_folder_thumbnail(
+            folder_path_str, stored_image, stored_mtime_ns, list_item
+        ):
+            return True
+        if stored_thumbnail and self._set_folder_thumbnail_data(
+            folder_path_str, stored_image, list_item, stored_thumbnail
+        ):
+            return True
+        return self.set_folder_thumbnail(folder_path_str, stored_image)
+
+    def cancel_folder_previews(self):
+        """
+        Cancel all queued and running folder preview tasks.
+
+        Queued tasks are dropped from the pool, and running tasks see their
+        cancel event set and stop at the next entry. A fresh event is created
+        for tasks started afterwards.
+
+        Side effects:
+            - Clears self.pending_folder_previews
+            - Replaces self._preview_cancel_event
+            - Lets the delegate request thumbnails again for repainted rows
+        """
+        self._preview_cancel_event.set()
+        self.preview_pool.clear()
+        self._preview_cancel_event = threading.Event()
+        self.pending_folder_previews.clear()
+        self._pending_folder_preview_requests = []
+        self._folder_preview_batch_timer.stop()
+        self.folder_thumbnail_delegate.reset()
+
+    @Slot(str, str, QImage)
+    def set_folder_thumbnail_image(self, folder_path_str, image_path_str, thumbnail_image):
+        """
+        Show a thumbnail decoded by a FolderPreviewTask.
+
+        Args:
+            folder_path_str (str): The folder the thumbnail belongs to
+            image_path_str (str): The image the thumbnail was decoded from
+            thumbnail_image (QImage): The decoded thumbnail
+
+        Side effects:
+            - Inserts the folder's thumbnail into QPixmapCache
+            - Sets the icon of the corresponding list widget item
+        """
+        item = self.subfolder_items_cache.get(folder_path_str)
+        if item is None:
+            # The folder left the list (e.g. it was merged) while the task ran
+            return
+        pixmap = QPixmap.fromImage(thumbnail_image)
+        if pixmap.isNull():
+            self.log_message(
+                f"Created null pixmap for {os.path.basename(image_path_str)}"
+            )
+            return
+        self._show_folder_thumbnail(folder_path_str, image_path_str, item, pixmap)
+
     def set_folder_thumbnail(self, folder_path_str, image_path_str):
         """
         Set the thumbnail for a folder in the subfolder list widget.
         
         This method updates the icon of a list widget item to display a thumbnail
-        image representing the folder's contents. It handles various edge cases and
-        error conditions when loading or displaying thumbnails.
+        image representing the folder's contents. The decoded thumbnail is also
+        cached in QPixmapCache under the folder's own key, so the next request
+        for the folder needs no decode.
         
         Args:
             folder_path_str (str): The path of the folder for which to set the thumbnail
             image_path_str (str): The path of the thumbnail image to set
+
+        Returns:
+            bool: True if the thumbnail was loaded and set, False otherwise
             
         Side effects:
-            - Updates the folder_preview_cache dictionary
+            - Inserts the folder's thumbnail into QPixmapCache
             - Sets the icon of the corresponding list widget item
             - Logs any errors encountered during thumbnail loading or setting
         """
         try:
-            self.folder_preview_cache[folder_path_str] = image_path_str
-            self.folder_preview_cache_by_name[Path(folder_path_str).name] = image_path_str
-
-            if not os.path.isfile(image_path_str) or not os.access(
-                image_path_str, os.R_OK
-            ):
-                self.log_message(f"Thumbnail image not accessible: {image_path_str}")
-                return
-
-            found_item = False
-            item = getattr(self, 'subfolder_items_cache', {}).get(folder_path_str)
-            if item:
-                found_item = True
-                try:
-                    reader = QImageReader(image_path_str)
-                    reader.setScaledSize(QSize(64, 64))
-
-                    if reader.canRead():
-                        thumbnail = reader.read()
-                        if not thumbnail.isNull():
-                            pixmap = QPixmap.fromImage(thumbnail)
-                            if not pixmap.isNull():
-                                item.setIcon(QIcon(pixmap))
-                            else:
-                                self.log_message(
-                                    f"Created null pixmap for {Path(image_path_str).name}"
-                                )
-                        else:
-                            self.log_message(
-                                f"Image read failed: {Path(image_path_str).name}: {reader.errorString()}"
-                            )
-                    else:
-                        self.log_message(
-                            f"Cannot read image: {Path(image_path_str).name}: {reader.errorString()}"
-                        )
-                except Exception as thumbnail_error:
-                    self.log_message(
-                        f"Error creating thumbnail: {thumbnail_error}"
-                    )
-
-            if not found_item:
+            item = self.subfolder_items_cache.get(folder_path_str)
+            if item is None:
                 self.log_message(
-                    f"No matching folder item found for {Path(folder_path_str).name}"
+                    f"No matching folder item found for {os.path.basename(folder_path_str)}"
                 )
+                return False
+
+            pixmap = self.load_thumbnail_pixmap(image_path_str, FOLDER_THUMBNAIL_SIZE)
+            if pixmap is None:
+                return False
+            self._show_folder_thumbnail(folder_path_str, image_path_str, item, pixmap)
+            return True
         except Exception as e:
             self.log_message(f"Error in set_folder_thumbnail: {e}")
+            return False
+
+    def _set_folder_thumbnail_data(self, folder_path_str, image_path_str, list_item, data):
+        """
+        Show a thumbnail loaded from the persistent preview store.
+
+        Args:
+            folder_path_str (str): The folder the thumbnail belongs to
+            image_path_str (str): The image the thumbnail was made from
+            list_item (QListWidgetItem): The folder's list item
+            data (bytes): Encoded thumbnail as written by _encode_thumbnail
+
+        Returns:
+            bool: True if the data could be decoded and was set
+        """
+        pixmap = QPixmap()
+        if not pixmap.loadFromData(data):
+            return False
+        self._show_folder_thumbnail(folder_path_str, image_path_str, list_item, pixmap)
+        return True
+
+    def _show_cached_folder_thumbnail(
+        self, folder_path_str, image_path_str, image_mtime_ns, list_item
+    ):
+        """
+        Show a folder's thumbnail if QPixmapCache still holds it.
+
+        Args:
+            folder_path_str (str): The folder the thumbnail belongs to
+            image_path_str (str): The folder's preview image
+            image_mtime_ns (int): The preview image's current st_mtime_ns
+            list_item (QListWidgetItem): The folder's list item
+
+        Returns:
+            bool: True if the cached thumbnail was found and set
+        """
+        pixmap = QPixmapCache.find(
+            self._folder_pixmap_cache_key(folder_path_str, image_path_str, image_mtime_ns)
+        )
+        if pixmap is None:
+            return False
+        list_item.setData(FOLDER_PREVIEW_IMAGE_ROLE, image_path_str)
+        list_item.setIcon(QIcon(pixmap))
+        return True
+
+    def _show_folder_thumbnail(self, folder_path_str, image_path_str, list_item, pixmap):
+        """
+        Set a folder row's icon and cache it for the next request.
+
+        The preview image is remembered on the item so request_folder_previews
+        can rebuild the cache key, including the image's current mtime.
+
+        Args:
+            folder_path_str (str): The folder the thumbnail belongs to
+            image_path_str (str): The image the thumbnail was made from
+            list_item (QListWidgetItem): The folder's list item
+            pixmap (QPixmap): The thumbnail
+        """
+        list_item.setIcon(QIcon(pixmap))
+        try:
+            mtime_ns = os.stat(image_path_str).st_mtime_ns
+        except OSError:
+            return  # Shown, but not worth caching for an image that is gone
+        list_item.setData(FOLDER_PREVIEW_IMAGE_ROLE, image_path_str)
+        QPixmapCache.insert(
+            self._folder_pixmap_cache_key(folder_path_str, image_path_str, mtime_ns),
+            pixmap,
+        )
+
+    def _folder_pixmap_cache_key(self, folder_path_str, image_path_str, mtime_ns):
+        """
+        Build the QPixmapCache key for a folder's thumbnail.
+
+        Like _pixmap_cache_key, the key includes the preview image's path and
+        modification time, so an image edited in place is decoded again.
+
+        Args:
+            folder_path_str (str): Path of the folder
+            image_path_str (str): Path of the folder's preview image
+            mtime_ns (int): The preview image's st_mtime_ns, as validated by
+                the preview store
+
+        Returns:
+            str: The cache key
+        """
+        size = FOLDER_THUMBNAIL_SIZE
+        return (
+            f"folder|{folder_path_str}|{image_path_str}|{mtime_ns}|"
+            f"{size.width()}x{size.height()}"
+        )
+
+    def _pixmap_cache_key(self, image_path_str, variant, mtime=None):
+        """
+        Build a QPixmapCache key for a decoded version of an image file.
+
+        The key includes the file's modification time so that an image edited
+        on disk is decoded again instead of being served from the cache.
+
+        Args:
+            image_path_str (str): Path of the image file
+            variant (str): Which decoded form the key is for, e.g. "64x64"
+            mtime (float, optional): The file's modification time, if the caller
+                already has it; otherwise it is read from disk
+
+        Returns:
+            str: The cache key
+
+        Raises:
+            OSError: If the file's modification time cannot be read
+        """
+        if mtime is None:
+            mtime = os.path.getmtime(image_path_str)
+        return f"{image_path_str}|{mtime}|{variant}"
+
+    def load_thumbnail_pixmap(self, image_path_str, size):
+        """
+        Load a scaled thumbnail pixmap for an image, using QPixmapCache.
+
+        Thumbnails are decoded directly at a reduced size with QImageReader, which
+        lets JPEG decoders skip most of the full-resolution work, and are cached
+        application-wide, so re-populating the subfolder list after a
+        merge or refresh does not decode the same image again.
+
+        Args:
+            image_path_str (str): Path of the image to load
+            size (QSize): Bounding size to decode the image at; the aspect
+                ratio is preserved
+
+        Returns:
+            QPixmap: The thumbnail pixmap, or None if the image could not be read.
+                     Failures are written to the activity log.
+        """
+        image_name = os.path.basename(image_path_str)
+        try:
+            cache_key = self._pixmap_cache_key(
+                image_path_str, f"{size.width()}x{size.height()}"
+            )
+        except OSError as e:
+            self.log_message(f"Cannot read image: {image_name}: {e}")
+            return None
+
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is not None:
+            return pixmap
+
+        try:
+            thumbnail, error_message = read_scaled_image(image_path_str, size)
+            if thumbnail is None:
+                self.log_message(error_message)
+                return None
+
+            pixmap = QPixmap.fromImage(thumbnail)
+            if pixmap.isNull():
+                self.log_message(f"Created null pixmap for {image_name}")
+                return None
+        except Exception as thumbnail_error:
+            self.log_message(f"Error creating thumbnail: {thumbnail_error}")
+            return None
+
+        QPixmapCache.insert(cache_key, pixmap)
+        return pixmap
 
     @Slot(QListWidgetItem, QListWidgetItem)
     def trigger_subfolder_preview(self, current, previous=None):
@@ -909,32 +1350,51 @@ class ImageFolderTool(QMainWindow):
         Args:
             current (QListWidgetItem): The currently selected item in the subfolder list.
             previous (QListWidgetItem): The previously selected item in the subfolder list.
+        The scan is debounced: the folder is only remembered here, and the scan
+        starts once no other folder has been picked for
+        SUBFOLDER_PREVIEW_DEBOUNCE_MS, so quickly moving through the list does
+        not start and cancel a scan per folder.
+        '''
+        if current:
+            subfolder_path_str = current.data(FOLDER_PATH_STR_ROLE)
+            if subfolder_path_str:
+                self._pending_subfolder_preview = subfolder_path_str
+                self._preview_debounce.start()
+
+    @Slot()
+    def _do_pending_subfolder_preview(self):
+        '''
+        Start the image scan for the folder last passed to trigger_subfolder_preview.
         This method stops any running worker thread, clears the preview area,
         and starts a new worker thread to scan for images in the selected subfolder.
         '''
-        if current:
-            subfolder_path = current.data(Qt.ItemDataRole.UserRole)
-            if subfolder_path and subfolder_path.is_dir():
-                if (
-                    subfolder_path == self.last_previewed_folder
-                    and self.worker_thread
-                    and self.current_task_type == "scan_subfolder_images"
-                ):
-                    self.log_message(f"Already scanning '{subfolder_path.name}'.")
-                    return
+        # Paths stay strings here; both come from the item's string role, so a
+        # plain string compare is enough to spot a repeated request
+        subfolder_path_str = self._pending_subfolder_preview
+        self._pending_subfolder_preview = None
+        if not subfolder_path_str or not os.path.isdir(subfolder_path_str):
+            return
+        folder_name = os.path.basename(subfolder_path_str)
+        if (
+            subfolder_path_str == self.last_previewed_folder
+            and self.worker_thread
+            and self.current_task_type == "scan_subfolder_images"
+        ):
+            self.log_message(f"Already scanning '{folder_name}'.")
+            return
 
-                self.stop_worker_thread()
-                self.clear_preview_area()
-                self.last_previewed_folder = subfolder_path
-                self.log_message(f"Previewing folder: {subfolder_path.name}")
-                self.image_path_label.setText(f"Scanning '{subfolder_path.name}'...")
-                self.start_subfolder_scan(subfolder_path)
+        self.stop_worker_thread()
+        self.clear_preview_area()
+        self.last_previewed_folder = subfolder_path_str
+        self.log_message(f"Previewing folder: {folder_name}")
+        self.image_path_label.setText(f"Scanning '{folder_name}'...")
+        self.start_subfolder_scan(subfolder_path_str)
 
     def start_subfolder_scan(self, folder_path):
         '''
         Start a scan for images in the selected subfolder.
         Args:
-            folder_path (Path): The path of the subfolder to scan for images.
+            folder_path (str or Path): The path of the subfolder to scan for images.
         This method stops any running worker thread, clears the preview area,
         and starts a new worker thread to scan for images in the selected subfolder.
         It also updates the UI state to indicate that a scan is in progress.
@@ -954,25 +1414,27 @@ class ImageFolderTool(QMainWindow):
     def clear_preview_area(self):
         '''
         Clear the image preview area and reset the state variables.
-        This method clears the image list widget, resets the preview label,
+        This method clears the image list model, resets the preview label,
         and updates the image path label to indicate that no image is selected.
-        It also clears the list of image files in the preview area.
+        It also cancels pending thumbnail decodes.
         '''
-        self.image_list_widget.clear()
+        self.cancel_thumbnail_tasks()
+        self.image_list_model.clear()
+        self._large_preview_source = None
+        self._large_preview = None
         self.preview_label.clear()
         self.preview_label.setText("Image Preview")
         self.image_path_label.setText("Select subfolder to preview images")
-        self.image_files_in_preview = []
 
     @Slot(list)
     def add_image_paths_to_list(self, paths):
         '''
-        Add image paths to the image list widget and set their thumbnails.
+        Add a batch of image paths found by the scan worker to the image list.
         Args:
-            paths (list): List of image paths to add to the image list widget.
-        This method iterates over the provided image paths, creates a QListWidgetItem
-        for each image, and sets its icon to the corresponding thumbnail. It also
-        handles errors while loading thumbnails and logs any issues encountered.
+            paths (list): List of image path strings to add.
+        The paths are appended to the image list model as plain strings; no item
+        or icon objects are created here. Thumbnails are requested by the model
+        when their rows are first painted (see request_image_thumbnail).
         '''
         worker = self.sender()
         if (
@@ -981,98 +1443,276 @@ class ImageFolderTool(QMainWindow):
         ):
             return
 
-        for image_path_str in paths:
-            image_path = Path(image_path_str)
-            item = QListWidgetItem(image_path.name)
-            item.setData(Qt.ItemDataRole.UserRole, image_path_str)
+        self.image_list_model.append_paths(paths)
 
-            try:
-                reader = QImageReader(image_path_str)
-                reader.setScaledSize(THUMBNAIL_SIZE)
-                thumbnail = reader.read()
+    def _image_thumbnail_cache_key(self, image_path_str, mtime=None):
+        """
+        Build the QPixmapCache key for an image list thumbnail.
 
-                if not thumbnail.isNull():
-                    item.setIcon(QIcon(QPixmap.fromImage(thumbnail)))
-                else:
-                    self.log_message(
-                        f"Could not load thumbnail for {image_path.name}: {reader.errorString()}"
+        Raises:
+            OSError: If the file's modification time cannot be read
+        """
+        return self._pixmap_cache_key(
+            image_path_str, f"{THUMBNAIL_SIZE.width()}x{THUMBNAIL_SIZE.height()}", mtime
+        )
+
+    @Slot(str)
+    def request_image_thumbnail(self, image_path_str):
+        """
+        Provide the thumbnail for an image list row the view has just painted.
+
+        Connected (queued) to ImageListModel.thumbnail_needed. A thumbnail that
+        is already in QPixmapCache is handed to the model directly. If the image
+        is the one shown in the large preview, its full decode is still held and
+        the thumbnail is scaled down from it instead of reading the file again.
+        Otherwise the path is collected, and all rows requested by the same paint
+        pass are handed to _start_thumbnail_tasks once control returns to the
+        event loop.
+
+        Args:
+            image_path_str (str): Path of the image
+        """
+        if not self.image_list_model.contains(image_path_str):
+            return  # The list was cleared before the request was delivered
+        try:
+            mtime = os.path.getmtime(image_path_str)
+        except OSError as e:
+            self.log_message(f"Cannot read image: {os.path.basename(image_path_str)}: {e}")
+            return
+        cache_key = self._image_thumbnail_cache_key(image_path_str, mtime)
+        if QPixmapCache.find(cache_key) is not None:
+            self.image_list_model.set_thumbnail(image_path_str, cache_key)
+            return
+        full_pixmap = None
+        if self._large_preview_source is not None:
+            source_path, source_mtime, source_pixmap = self._large_preview_source
+            if source_path == image_path_str and source_mtime == mtime:
+                full_pixmap = source_pixmap
+        if full_pixmap is not None:
+            thumbnail = full_pixmap
+            # Like read_scaled_image, only ever scale down
+            if (
+                full_pixmap.width() > THUMBNAIL_SIZE.width()
+                or full_pixmap.height() > THUMBNAIL_SIZE.height()
+            ):
+                # A cheap nearest-neighbour pass does most of the reduction;
+                # the smooth pass then only filters a small image
+                if (
+                    full_pixmap.width() > 4 * THUMBNAIL_SIZE.width()
+                    or full_pixmap.height() > 4 * THUMBNAIL_SIZE.height()
+                ):
+                    thumbnail = full_pixmap.scaled(
+                        THUMBNAIL_SIZE * 2,
+                        Qt.AspectRatioMode.KeepAspectRatio,
+                        Qt.TransformationMode.FastTransformation,
                     )
-                    item.setIcon(QIcon.fromTheme("image-missing"))
-            except Exception as e:
-                self.log_message(f"Thumbnail error for {image_path.name}: {e}")
-                item.setIcon(QIcon.fromTheme("image-missing"))
+                thumbnail = thumbnail.scaled(
+                    THUMBNAIL_SIZE,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation,
+                )
+            QPixmapCache.insert(cache_key, thumbnail)
+            self.image_list_model.set_thumbnail(image_path_str, cache_key)
+            return
+        self._pending_thumbnail_paths.append(image_path_str)
+        self._thumbnail_batch_timer.start()
+
+    @Slot()
+    def _start_thumbnail_tasks(self):
+        """
+        Queue ThumbnailTasks for the collected thumbnail requests.
 
-            self.image_list_widget.addItem(item)
-            self.image_files_in_preview.append(image_path_str)
+        The paths are split into batches of at most THUMBNAIL_BATCH_SIZE, but
+        small enough that every pool thread gets a share of a short request.
+
+        Side effects:
+            - Clears self._pending_thumbnail_paths
+            - Queues ThumbnailTasks on self.thumbnail_pool
+        """
+        paths = self._pending_thumbnail_paths
+        self._pending_thumbnail_paths = []
+        if not paths:
+            return
+        threads = max(1, self.thumbnail_pool.maxThreadCount())
+        batch_size = max(1, min(THUMBNAIL_BATCH_SIZE, -(-len(paths) // threads)))
+        for start in range(0, len(paths), batch_size):
+            self.thumbnail_pool.start(
+                ThumbnailTask(
+                    paths[start:start + batch_size],
+                    THUMBNAIL_SIZE,
+                    self._thumbnail_signals,
+                    self._thumbnail_cancel_event,
+                )
+            )
+
+    @Slot(list)
+    def set_image_thumbnails(self, thumbnails):
+        """
+        Show a batch of thumbnails decoded by a ThumbnailTask in the image list.
+
+        Args:
+            thumbnails (list): (image path, decoded QImage) tuples
+
+        Side effects:
+            - Inserts the thumbnails into QPixmapCache
+            - Repaints the matching image list rows that are still listed
+        """
+        for image_path_str, image in thumbnails:
+            if not self.image_list_model.contains(image_path_str):
+                continue  # The list was cleared while the task was running
+            pixmap = QPixmap.fromImage(image)
+            if pixmap.isNull():
+                self.log_message(
+                    f"Created null pixmap for {os.path.basename(image_path_str)}"
+                )
+                continue
+            try:
+                cache_key = self._image_thumbnail_cache_key(image_path_str)
+            except OSError:
+                continue
+            QPixmapCache.insert(cache_key, pixmap)
+            self.image_list_model.set_thumbnail(image_path_str, cache_key)
+
+    @Slot(str, str)
+    def handle_thumbnail_failed(self, image_path_str, error_message):
+        """
+        Log a thumbnail that could not be decoded; its row keeps the placeholder icon.
+
+        Args:
+            image_path_str (str): Path of the image
+            error_message (str): Why decoding failed
+        """
+        if self.image_list_model.contains(image_path_str):
+            self.log_message(error_message)
+
+    def cancel_thumbnail_tasks(self):
+        """
+        Drop queued image list thumbnail tasks and stop those not yet started.
+
+        Side effects:
+            - Drops requests not yet handed to the pool
+            - Replaces self._thumbnail_cancel_event
+        """
+        self._thumbnail_batch_timer.stop()
+        self._pending_thumbnail_paths = []
+        self._thumbnail_cancel_event.set()
+        self.thumbnail_pool.clear()
+        self._thumbnail_cancel_event = threading.Event()
 
     @Slot()
     def show_large_preview(self):
         '''
         Show a large preview of the selected image in the image list widget.
-        This method retrieves the currently selected image from the list widget,
+        This method retrieves the currently selected image from the list view,
         loads its thumbnail, and displays it in the preview area. It also updates
         the image path label to show the selected image's path.
         If no image is selected, it clears the preview area and resets the labels.
         '''
-        selected_items = self.image_list_widget.selectedItems()
-        if not selected_items:
+        selected_indexes = self.image_list_view.selectionModel().selectedIndexes()
+        if not selected_indexes:
             self.preview_label.clear()
             self.preview_label.setText("Image Preview")
             self.image_path_label.setText("Select an image from the list above")
             return
 
-        item = selected_items[0]
-        image_path_str = item.data(Qt.ItemDataRole.UserRole)
+        image_path_str = selected_indexes[0].data(Qt.ItemDataRole.UserRole)
         if not image_path_str:
             return
 
-        image_path = Path(image_path_str)
-        if not image_path.is_file():
+        # One stat both checks that the file still exists and keys the caches
+        try:
+            mtime = os.path.getmtime(image_path_str)
+        except OSError:
             self.log_message(f"Preview error: File not found - {image_path_str}")
             self.preview_label.setText("Error: File not found")
             self.image_path_label.setText("Error: File not found")
             return
 
+        parent_dir, image_name = os.path.split(image_path_str)
         self.image_path_label.setText(
-            f"...{os.path.sep}{image_path.parent.name}{os.path.sep}{image_path.name}"
+            f"...{os.path.sep}{os.path.basename(parent_dir)}{os.path.sep}{image_name}"
         )
-        pixmap = QPixmap(image_path_str)
+        scroll_area = self.preview_scroll_area
+        available_width = PREVIEW_AREA_MIN_WIDTH
+
+        if scroll_area and scroll_area.viewport():
+            available_width = scroll_area.viewport().width() - 20
+        elif self.preview_label.width() > 50:
+            available_width = self.preview_label.width() - 20
+
+        available_width = max(available_width, 300)
+
+        # Re-showing the same image at the same width reuses the scaled pixmap,
+        # skipping both the decode and the smooth rescale
+        if self._large_preview is not None:
+            shown_path, shown_mtime, shown_width, scaled_pixmap = self._large_preview
+            if (shown_path, shown_mtime, shown_width) == (
+                image_path_str,
+                mtime,
+                available_width,
+            ):
+                self.preview_label.setPixmap(scaled_pixmap)
+                return
+
+        # A resize only rescales; the file is decoded once per selected image
+        pixmap = None
+        if self._large_preview_source is not None:
+            source_path, source_mtime, source_pixmap = self._large_preview_source
+            if source_path == image_path_str and source_mtime == mtime:
+                pixmap = source_pixmap
+        if pixmap is None:
+            pixmap = QPixmap(image_path_str)
+            self._large_preview_source = (
+                (image_path_str, mtime, pixmap) if not pixmap.isNull() else None
+            )
 
         if pixmap.isNull():
             self.log_message(f"Preview error: Could not load image - {image_path_str}")
-            self.preview_label.setText(f"Cannot load\n{image_path.name}")
+            self.preview_label.setText(f"Cannot load\n{image_name}")
             return
 
         try:
-            scroll_area = None
-            parent = self.preview_label.parent()
-            while parent:
-                if isinstance(parent, QScrollArea):
-                    scroll_area = parent
-                    break
-                parent = parent.parent()
-
-            available_width = PREVIEW_AREA_MIN_WIDTH
-
-            if scroll_area and scroll_area.viewport():
-                available_width = scroll_area.viewport().width() - 20
-            elif self.preview_label.width() > 50:
-                available_width = self.preview_label.width() - 20
-
-            available_width = max(available_width, 300)
-
             if pixmap.width() > available_width:
                 scaled_pixmap = pixmap.scaledToWidth(
                     available_width, Qt.TransformationMode.SmoothTransformation
                 )
             else:
                 scaled_pixmap = pixmap
+            self._large_preview = (
+                image_path_str, mtime, available_width, scaled_pixmap
+            )
 
             self.preview_label.setPixmap(scaled_pixmap)
         except Exception as e:
             self.log_message(f"Error scaling preview: {e}")
             self.preview_label.setText("Error displaying preview")
 
+    def eventFilter(self, watched, event):
+        """
+        Restart the preview rescale timer when the preview area is resized.
+
+        Resizing the window or dragging the splitter produces a stream of
+        resize events; the image is only rescaled once they stop, and
+        show_large_preview rescales the decoded image it keeps in
+        _large_preview_source instead of reading the file again. Only the
+        current image and width are kept, in _large_preview.
+
+        Args:
+            watched (QObject): The object the event was sent to
+            event (QEvent): The event
+
+        Returns:
+            bool: Always the base implementation's result; events are not consumed
+        """
+        if (
+            event.type() == QEvent.Type.Resize
+            and watched is self.preview_scroll_area.viewport()
+            and event.size().width() != event.oldSize().width()
+            and self.image_list_view.selectionModel().hasSelection()
+        ):
+            self._preview_resize_debounce.start()
+        return super().eventFilter(watched, event)
+
     @Slot()
     def update_merge_button_state(self):
         """
@@ -1081,6 +1721,8 @@ class ImageFolderTool(QMainWindow):
         This method checks if there are any checked subfolder items and 
         if a root folder is selected. The merge button is enabled only when
         at least one subfolder is checked and a valid root folder exists.
+        The checked count comes from self._checked_subfolder_paths, which is
+        kept up to date incrementally, so no rows are visited here.
         
         The button text is updated to show the count of selected folders.
         
@@ -1088,8 +1730,7 @@ class ImageFolderTool(QMainWindow):
             - Changes the enabled state of self.merge_button
             - Updates the text of self.merge_button with selection count
         """
-        checked_items = self.get_checked_subfolder_items()
-        count = len(checked_items)
+        count = len(self._checked_subfolder_paths)
         
         # Update button text to include folder count
         if count > 0:
@@ -1101,21 +1742,45 @@ class ImageFolderTool(QMainWindow):
             count > 0 and self.current_root_folder is not None
         )
 
+    @Slot(QListWidgetItem)
+    def _on_subfolder_item_changed(self, item):
+        """
+        Keep self._checked_subfolder_paths in sync with a changed subfolder row.
+
+        itemChanged also fires for icon updates, so this only touches the
+        changed item and refreshes the merge button if its check state moved.
+
+        Args:
+            item (QListWidgetItem): The item that changed
+        """
+        folder_path_str = item.data(FOLDER_PATH_STR_ROLE)
+        was_checked = folder_path_str in self._checked_subfolder_paths
+        if item.checkState() == Qt.CheckState.Checked:
+            self._checked_subfolder_paths.add(folder_path_str)
+        else:
+            self._checked_subfolder_paths.discard(folder_path_str)
+        if was_checked != (folder_path_str in self._checked_subfolder_paths):
+            self.update_merge_button_state()
+
     def get_checked_subfolder_items(self):
         """
         Get all checked items from the subfolder list widget.
         
-        This method iterates through all items in the subfolder list widget
-        and collects those that are checked by the user.
+        The items are looked up from the tracked checked paths and returned in
+        list order, so merges process their sources in the order shown. Items
+        that have already been taken out of the list are skipped, so a stale
+        entry can never become a merge source.
         
         Returns:
             list: A list of QListWidgetItems that are checked in the subfolder list
         """
+        list_widget = self.subfolder_list_widget
         checked_items = []
-        for index in range(self.subfolder_list_widget.count()):
-            item = self.subfolder_list_widget.item(index)
-            if item.checkState() == Qt.CheckState.Checked:
+        for path in self._checked_subfolder_paths:
+            item = self.subfolder_items_cache.get(path)
+            if item is not None and item.listWidget() is list_widget:
                 checked_items.append(item)
+        checked_items.sort(key=list_widget.row)
         return checked_items
 
     @Slot()
@@ -1150,7 +1815,8 @@ class ImageFolderTool(QMainWindow):
         source_folders = []
         source_names = []
         for item in checked_items:
-            folder_path = item.data(Qt.ItemDataRole.UserRole)
+            folder_path_str = item.data(FOLDER_PATH_STR_ROLE)
+            folder_path = Path(folder_path_str) if folder_path_str else None
             if folder_path and folder_path.is_dir():
                 source_folders.append(folder_path)
                 source_names.append(folder_path.name)
@@ -1188,7 +1854,8 @@ class ImageFolderTool(QMainWindow):
             )
             return
 
-        source_list_str = "\n - ".join(sorted([p.name for p in source_folders]))
+        # source_names is already sorted and holds the same names
+        source_list_str = "\n - ".join(source_names)
         confirmation_message = (
             f"This will merge ALL content recursively from the following SOURCE subfolders:\n"
             f" - {source_list_str}\n\n"
@@ -1249,7 +1916,7 @@ class ImageFolderTool(QMainWindow):
             - Disables the UI
             - Sets the current task type to "merge_subs"
         """
-        self.log_message(f"Starting merge into '{Path(target_path_str).name}'...")
+        self.log_message(f"Starting merge into '{os.path.basename(target_path_str)}'...")
         self.enable_ui(False)
 
         self.current_task_type = "merge_subs"
@@ -1267,28 +1934,30 @@ class ImageFolderTool(QMainWindow):
         """
         Safely stop any running worker thread.
         
-        This method attempts to gracefully stop the currently running worker thread.
-        If the thread doesn't stop within the timeout period, it is forcefully terminated.
-        The UI is re-enabled after the thread is stopped.
+        This method asks the currently running worker thread to stop and returns
+        without waiting for it. The worker checks its stop flag between files and
+        exits on its own; until then it is kept referenced in _dying_workers, and
+        any results it still emits are ignored. The UI is re-enabled immediately.
         
         Side effects:
+            - Cancels a pending debounced subfolder preview
             - May stop a running worker thread
             - Resets worker thread related state variables
             - Re-enables the UI
             - Logs the thread stopping status
         """
+        # A debounced preview must not start after the caller asked for a stop
+        self._preview_debounce.stop()
+        self._pending_subfolder_preview = None
+
         worker_to_stop = self.worker_thread
         if worker_to_stop and worker_to_stop.isRunning():
             task = self.current_task_type or "unknown task"
             self.log_message(f"Attempting to cancel {task}...")
             worker_to_stop.stop()
-            
-            # Wait longer for thread to finish naturally
-            if not worker_to_stop.wait(2000):  # Increase timeout to 2 seconds
-                self.log_message(f"Warning: Worker thread ({task}) did not stop gracefully. Terminating.")
-                worker_to_stop.terminate()
-                # Always wait again after terminate()
-                worker_to_stop.wait()
+            # Keep a reference so the QThread isn't destroyed while still running;
+            # task_finished releases it once its last signal has been delivered
+            self._dying_workers.append(worker_to_stop)
 
             if self.worker_thread == worker_to_stop:
                 self.worker_thread = None
@@ -1298,6 +1967,19 @@ class ImageFolderTool(QMainWindow):
             else:
                 self.log_message(f"Stopped an older worker for task {task}.")
 
+    def _is_stale_worker_signal(self):
+        """
+        Check whether the slot being run was triggered by an outdated worker.
+
+        Signals are queued, so a stopped or replaced worker's results can still
+        arrive after another worker has taken its place.
+
+        Returns:
+            bool: True if the sender is a Worker other than self.worker_thread
+        """
+        sender = self.sender()
+        return isinstance(sender, Worker) and sender is not self.worker_thread
+
     @Slot()
     def uncheck_all_subfolders(self):
         """
@@ -1313,13 +1995,16 @@ class ImageFolderTool(QMainWindow):
             - Updates the merge button state
             - Logs the action
         """
-        for index in range(self.subfolder_list_widget.count()):
-            item = self.subfolder_list_widget.item(index)
-            if item and item.checkState() == Qt.CheckState.Checked:
+        signals_were_blocked = self.subfolder_list_widget.blockSignals(True)
+        try:
+            for item in self.get_checked_subfolder_items():
                 item.setCheckState(Qt.CheckState.Unchecked)
+        finally:
+            self.subfolder_list_widget.blockSignals(signals_were_blocked)
         
         # Clear the checked names cache
         self._checked_folder_names_cache.clear()
+        self._checked_subfolder_paths.clear()
         self.log_message("All folders unchecked.")
         self.update_merge_button_state()  # Update button state after changes
 
@@ -1360,50 +2045,67 @@ class ImageFolderTool(QMainWindow):
         Side effects:
             - Reorders the items in the subfolder list widget
             - Preserves item checked states and selection
+            - Blocks list signals while items are taken and reinserted
         """
-        # Store the current selection and checked state
+        # Store the current selection; checked states are tracked in
+        # self._checked_subfolder_paths already
         current_item = self.subfolder_list_widget.currentItem()
-        current_path = current_item.data(Qt.ItemDataRole.UserRole) if current_item else None
-        
-        checked_items = {}
-        for index in range(self.subfolder_list_widget.count()):
-            item = self.subfolder_list_widget.item(index)
-            if item:
-                folder_path = item.data(Qt.ItemDataRole.UserRole)
-                checked_items[str(folder_path)] = item.checkState() == Qt.CheckState.Checked
-        
-        # Get all items
-        items = []
-        for index in range(self.subfolder_list_widget.count()):
-            item = self.subfolder_list_widget.takeItem(0)  # Always take from index 0
-            if item:
-                items.append(item)
-        
-        # Sort items
-        if self.use_natural_sort:
-            # Natural sort that handles numbers in folder names
-            items.sort(key=lambda x: self._natural_sort_key(x.text()))
-        else:
-            # Regular alphabetical sort
-            items.sort(key=lambda x: x.text().lower())
-        
-        # Re-add items in sorted order
-        for item in items:
-            self.subfolder_list_widget.addItem(item)
-            # Restore checked state
-            folder_path = item.data(Qt.ItemDataRole.UserRole)
-            if str(folder_path) in checked_items and checked_items[str(folder_path)]:
-                item.setCheckState(Qt.CheckState.Checked)
-            else:
-                item.setCheckState(Qt.CheckState.Unchecked)
+        current_path = current_item.data(FOLDER_PATH_STR_ROLE) if current_item else None
         
-        # Restore current selection only if we had one
-        if current_path:
-            for index in range(self.subfolder_list_widget.count()):
-                item = self.subfolder_list_widget.item(index)
-                if item and item.data(Qt.ItemDataRole.UserRole) == current_path:
-                    self.subfolder_list_widget.setCurrentItem(item)
-                    break
+        signals_were_blocked = self.subfolder_list_widget.blockSignals(True)
+        try:
+            self._reinsert_sorted_subfolder_items(current_path)
+        finally:
+            self.subfolder_list_widget.blockSignals(signals_were_blocked)
+
+    def _reinsert_sorted_subfolder_items(self, current_path):
+        """
+        Take every item out of the subfolder list and add it back in sorted order.
+
+        Args:
+            current_path (str): Folder path string of the item to reselect, or None.
+        """
+        list_widget = self.subfolder_list_widget
+        # The merge cleanup may already have suspended painting around this call
+        updates_were_enabled = list_widget.updatesEnabled()
+        list_widget.setUpdatesEnabled(False)
+        try:
+            # Take items from the end so no rows have to shift on each removal;
+            # clear() is not used since it would delete the items themselves
+            items = [
+                list_widget.takeItem(row)
+                for row in range(list_widget.count() - 1, -1, -1)
+            ]
+            # Back to list order, so items with equal keys keep their order
+            items.reverse()
+
+            # sort() computes each key once per item, not once per comparison
+            if self.use_natural_sort:
+                # Natural sort that handles numbers in folder names
+                items.sort(key=lambda x: self._natural_sort_key(x.text()))
+            else:
+                # Regular alphabetical sort
+                items.sort(key=lambda x: x.text().lower())
+
+            # Re-add items in sorted order
+            for item in items:
+                list_widget.addItem(item)
+                # Restore checked state
+                check_state = (
+                    Qt.CheckState.Checked
+                    if item.data(FOLDER_PATH_STR_ROLE) in self._checked_subfolder_paths
+                    else Qt.CheckState.Unchecked
+                )
+                if item.checkState() != check_state:
+                    item.setCheckState(check_state)
+
+            # Restore current selection only if we had one
+            if current_path:
+                item = self.subfolder_items_cache.get(current_path)
+                if item is not None:
+                    list_widget.setCurrentItem(item)
+        finally:
+            list_widget.setUpdatesEnabled(updates_were_enabled)
     
     def _natural_sort_key(self, text):
         """
@@ -1431,38 +2133,58 @@ class ImageFolderTool(QMainWindow):
         
         This method is called automatically when the application window is closing.
         It performs clean shutdown operations:
-        1. Stops the main worker thread
-        2. Stops all folder preview worker threads
-        3. Clears task queues and caches
-        4. Logs the application shutdown
+        1. Asks the main worker and all folder preview and thumbnail tasks to
+           stop at once, so they wind down in parallel
+        2. Waits up to CLOSE_POOL_WAIT_MS for the stopped workers. If one is
+           still running (e.g. a merge in the middle of a slow cross-device
+           copy), the window is hidden and the close is retried once
+           task_finished has released the last of them, because destroying a
+           running QThread aborts the process
+        3. Waits for both pools within one shared CLOSE_POOL_WAIT_MS budget
+        4. Closes the persistent preview cache
+        5. Logs the application shutdown
         
         Args:
             event (QCloseEvent): The close event object
             
         Side effects:
-            - Stops all running worker threads
-            - Clears task queues and caches
+            - Stops all running worker threads and preview tasks
             - Logs application shutdown
         """
-        # First stop the main worker
+        # Signal everything to stop before waiting on anything
         self.stop_worker_thread()
+        if self.pending_folder_previews:
+            self.log_message("Stopping folder preview tasks...")
+        self.cancel_folder_previews()
+        self.cancel_thumbnail_tasks()
+
+        # Stopped workers must exit before their QThread objects are destroyed.
+        # One stuck in a slow move or scandir (e.g. on a network drive) must not
+        # freeze the window, so it gets a bounded wait and the window is hidden
+        # until it has finished the file it is working on.
+        deadline = time.monotonic() + CLOSE_POOL_WAIT_MS / 1000
+        for worker in self._dying_workers:
+            worker.wait(max(0, int((deadline - time.monotonic()) * 1000)))
+        still_running = [worker for worker in self._dying_workers if worker.isRunning()]
+        if still_running:
+            tasks = ", ".join(worker.task_type for worker in still_running)
+            # The log area is about to disappear, so report on the console
+            print(f"Waiting for {tasks} to stop before exiting...")
+            self._close_when_workers_exit = True
+            self.hide()
+            event.ignore()
+            return
+
+        # Running pool tasks get one shared budget rather than one each
+        deadline = time.monotonic() + CLOSE_POOL_WAIT_MS / 1000
+        for pool in (self.preview_pool, self.thumbnail_pool):
+            pool.waitForDone(max(0, int((deadline - time.monotonic()) * 1000)))
+        self.preview_store.close()
 
-        # Then stop all preview tasks with proper logging
-        active_preview_tasks = list(self.folder_preview_tasks.items())
-        for folder_path, worker in active_preview_tasks:
-            if worker and worker.isRunning():
-                self.log_message(f"Stopping preview task for {Path(folder_path).name}...")
-                worker.stop()
-                # Wait longer during shutdown
-                if not worker.wait(500):  # 500ms per thread
-                    worker.terminate()
-                    worker.wait()
-                self.folder_preview_tasks.pop(folder_path, None)
-
-        # Clear all remaining tasks
-        self.folder_preview_tasks.clear()
-        self.waiting_folders.clear()
-        
         # Log application shutdown
         self.log_message("Application shutting down")
-        event.accept()
\ No newline at end of file
+        event.accept()
+        if self._close_when_workers_exit:
+            # The window was already hidden, so closing it does not count as the
+            # last window closing; quit as that would have done
+            QApplication.quit()
\ No newline at end of file
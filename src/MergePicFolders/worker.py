@@ -1,8 +1,17 @@
+import errno
+import threading
 import time
 import os
 import shutil
-from PySide6.QtCore import QThread, Signal
-from pathlib import Path
+from collections import OrderedDict, deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from PySide6.QtCore import QObject, QRunnable, QThread, Qt, Signal
+from PySide6.QtGui import QImage, QImageReader
 
 # --- Configuration ---
 SUPPORTED_IMAGE_EXTENSIONS = {
@@ -16,6 +25,362 @@ SUPPORTED_IMAGE_EXTENSIONS = {
     ".webp",
     ".heic",
 }
+# Image paths found by a scan are sent to the GUI in batches of this size
+IMAGE_PATH_BATCH_SIZE = 512
+# During a merge, report progress once per this many moved files
+MERGE_PROGRESS_INTERVAL = 100
+# Decode quality hint for JPEG thumbnails; below 50 selects the fast IDCT
+THUMBNAIL_JPEG_QUALITY = 25
+# Minimum number of seconds between high-frequency progress messages
+PROGRESS_MIN_INTERVAL = 0.1
+# Moves are I/O-bound, so overlap more of them than there are cores
+MERGE_MAX_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+# Upper bound on moves queued on the pool while the source is still being read
+MERGE_MAX_PENDING_MOVES = MERGE_MAX_WORKERS * 4
+# Number of folders whose complete image listing is kept for repeated scans
+IMAGE_LISTING_CACHE_SIZE = 16
+# Listings are not kept while a directory's mtime is this close to now: a file
+# added within the same timestamp tick (2 s on FAT) would not change it
+IMAGE_LISTING_MTIME_GRANULARITY_NS = 2_000_000_000
+# Same extensions without the leading dot, for matching raw file names
+_IMAGE_EXTENSIONS_NO_DOT = frozenset(ext[1:] for ext in SUPPORTED_IMAGE_EXTENSIONS)
+
+
+def _is_image_name(name):
+    """
+    Check whether a file name has a supported image extension.
+
+    Works on the raw name string instead of Path.suffix to avoid creating a
+    Path per file on hot scanning paths. The extension is looked up as-is
+    first, so the common all-lowercase case needs no lower() copy. Like
+    Path.suffix, a leading dot (e.g. ".png") does not count as an extension.
+
+    Args:
+        name (str): File name without any directory part
+
+    Returns:
+        bool: True if the extension is in SUPPORTED_IMAGE_EXTENSIONS
+    """
+    dot = name.rfind(".")
+    if dot <= 0:
+        return False
+    extension = name[dot + 1 :]
+    return (
+        extension in _IMAGE_EXTENSIONS_NO_DOT
+        or extension.lower() in _IMAGE_EXTENSIONS_NO_DOT
+    )
+
+
+def _iter_files(root, visited_dirs=None, dir_mtimes=None):
+    """
+    Walk a directory tree with os.scandir and yield its files.
+
+    Directories are visited depth-first using an explicit stack so no Path
+    objects are created per entry, and the type information cached on each
+    DirEntry avoids an extra stat() call per file. Entries are yielded while
+    their directory is still being read, so callers can start working (and
+    stop early) without waiting for the whole tree to be enumerated.
+    Symlinked directories are not descended into; unreadable directories
+    are skipped.
+
+    Each directory is listed before any of its subdirectories, so the
+    visited_dirs list, if given, can be iterated in reverse to visit children
+    before their parents (as os.walk(topdown=False) would).
+
+    Args:
+        root (str or Path): Directory to walk
+        visited_dirs (list, optional): Receives the path of every directory
+            the walk reads, root included
+        dir_mtimes (dict, optional): Receives each directory's st_mtime_ns,
+            taken just before the directory is read
+
+    Yields:
+        os.DirEntry: Each regular file (or symlink to one) in the tree
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        current_dir = stack.pop()
+        if visited_dirs is not None:
+            visited_dirs.append(current_dir)
+        try:
+            if dir_mtimes is not None:
+                dir_mtimes[current_dir] = os.stat(current_dir).st_mtime_ns
+            with os.scandir(current_dir) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+
+
+_image_listing_cache = OrderedDict()  # folder path -> (dir mtimes, image paths)
+_image_listing_lock = threading.Lock()
+
+
+def _get_cached_image_listing(folder_path_str):
+    """
+    Return the image paths recorded by an earlier complete scan of a folder.
+
+    A listing is only reused while every directory in the scanned tree still
+    has the modification time it had when it was read. Adding, removing or
+    renaming an entry changes its parent directory's mtime, so this detects
+    changes anywhere in the tree at the cost of one stat per directory
+    instead of reading every directory again.
+
+    Args:
+        folder_path_str (str): The scanned folder
+
+    Returns:
+        tuple: Image path strings, or None if there is no valid listing
+    """
+    with _image_listing_lock:
+        cached = _image_listing_cache.get(folder_path_str)
+        if cached is None:
+            return None
+        _image_listing_cache.move_to_end(folder_path_str)
+    dir_mtimes, image_paths = cached
+    try:
+        for dir_path, mtime_ns in dir_mtimes.items():
+            if os.stat(dir_path).st_mtime_ns != mtime_ns:
+                break
+        else:
+            return image_paths
+    except OSError:
+        pass
+    with _image_listing_lock:
+        _image_listing_cache.pop(folder_path_str, None)
+    return None
+
+
+def _store_image_listing(folder_path_str, dir_mtimes, image_paths):
+    """
+    Remember the result of a complete scan for _get_cached_image_listing.
+
+    Nothing is stored if a directory was modified within
+    IMAGE_LISTING_MTIME_GRANULARITY_NS of now, since a later change in the
+    same timestamp tick would leave its mtime unchanged.
+
+    Args:
+        folder_path_str (str): The scanned folder
+        dir_mtimes (dict): st_mtime_ns of every directory read by the scan
+        image_paths (list): Image path strings found by the scan
+    """
+    settled_before_ns = time.time_ns() - IMAGE_LISTING_MTIME_GRANULARITY_NS
+    if any(mtime_ns > settled_before_ns for mtime_ns in dir_mtimes.values()):
+        return
+    with _image_listing_lock:
+        _image_listing_cache[folder_path_str] = (dir_mtimes, tuple(image_paths))
+        _image_listing_cache.move_to_end(folder_path_str)
+        while len(_image_listing_cache) > IMAGE_LISTING_CACHE_SIZE:
+            _image_listing_cache.popitem(last=False)
+
+
+def _find_preview_image(folder_path, should_stop, max_depth=2):
+    """
+    Find the first suitable image in a folder to use as a preview thumbnail.
+
+    This function does a breadth-first os.scandir search of the folder and up
+    to max_depth levels of subfolders, returning as soon as it finds an image
+    file. Images directly in the folder are therefore preferred over images in
+    its subfolders, and large folders are not enumerated past the first hit.
+    Candidates are not stat'ed: an empty or broken image just fails to decode
+    later and the folder keeps its default icon.
+
+    Args:
+        folder_path (str or Path): Folder to search for preview images
+        should_stop (callable): Returns True when the search should be abandoned
+        max_depth (int, optional): How many levels of subfolders to search
+
+    Returns:
+        str: Path of the preview image, or None if none was found or the
+             search was stopped
+
+    Note:
+        This function only considers files with extensions defined in
+        SUPPORTED_IMAGE_EXTENSIONS. It skips files and folders that cannot be
+        accessed due to permissions or other I/O errors.
+    """
+    queue = deque([(os.fspath(folder_path), 0)])
+    while queue:
+        current_dir, depth = queue.popleft()
+        try:
+            with os.scandir(current_dir) as it:
+                for entry in it:
+                    if should_stop():
+                        return None
+                    if _is_image_name(entry.name) and entry.is_file():
+                        return entry.path
+                    elif depth < max_depth and entry.is_dir(follow_symlinks=False):
+                        queue.append((entry.path, depth + 1))
+        except OSError:
+            continue
+    return None
+
+
+def read_scaled_image(image_path_str, size):
+    """
+    Decode an image at a reduced size with QImageReader.
+
+    Setting the scaled size before reading lets JPEG decoders skip most of the
+    full-resolution work; images that already fit are not scaled at all. EXIF
+    orientation is still applied so photos are not shown rotated. Only QImage
+    is used, so this is safe to call from any thread.
+
+    Args:
+        image_path_str (str): Path of the image to decode
+        size (QSize): Bounding size to decode the image at; the aspect ratio
+            is preserved
+
+    Returns:
+        tuple: (QImage, None) on success, or (None, error message) on failure
+    """
+    image_name = os.path.basename(image_path_str)
+    reader = QImageReader(image_path_str)
+    reader.setAutoTransform(True)
+    source_size = reader.size()
+    # Images that already fit are read as-is instead of going through the scaler
+    if source_size.isValid() and (
+        source_size.width() > size.width() or source_size.height() > size.height()
+    ):
+        reader.setScaledSize(
+            source_size.scaled(size, Qt.AspectRatioMode.KeepAspectRatio)
+        )
+    if bytes(reader.format()) == b"jpeg":
+        # A low quality hint makes the JPEG plugin use the fast IDCT
+        reader.setQuality(THUMBNAIL_JPEG_QUALITY)
+    if not reader.canRead():
+        return None, f"Cannot read image: {image_name}: {reader.errorString()}"
+
+    image = reader.read()
+    if image.isNull():
+        return None, f"Image read failed: {image_name}: {reader.errorString()}"
+    return image, None
+
+
+class PreviewSignals(QObject):
+    """Signals emitted by FolderPreviewTask, which is not itself a QObject."""
+
+    folder_preview_image = Signal(str, str, QImage)  # folder_path, image_path, thumbnail
+    progress = Signal(str)
+    error = Signal(str)
+    finished = Signal(str)  # folder_path
+
+
+class FolderPreviewTask(QRunnable):
+    def __init__(self, folder_path, size, signals, cancel_event):
+        """
+        Initialize a thread pool task that finds and decodes a folder's preview image.
+
+        Args:
+            folder_path (str): Path of the folder to find a preview image for.
+            size (QSize): Bounding size of the thumbnail.
+            signals (PreviewSignals): Shared signal emitter used to report results.
+            cancel_event (threading.Event): Set to abandon the search early.
+        """
+        super().__init__()
+        self.folder_path = folder_path
+        self.size = size
+        self.signals = signals
+        self.cancel_event = cancel_event
+
+    def run(self):
+        """
+        Search the folder for a preview image, decode its thumbnail and report it.
+
+        The thumbnail is decoded here with read_scaled_image, so the GUI thread
+        only has to turn the QImage into a QPixmap.
+
+        Side effects:
+            - Emits folder_preview_image if an image is found and decoded and
+              the task was not cancelled
+            - Emits error if the folder is invalid or the search fails
+            - Always emits finished with the folder path
+        """
+        folder_path_str = self.folder_path
+        folder_name = os.path.basename(folder_path_str)
+        try:
+            if not os.path.isdir(folder_path_str):
+                self.signals.error.emit(
+                    f"Cannot scan: '{folder_name}' is not a valid directory."
+                )
+                return
+            image_path = _find_preview_image(folder_path_str, self.cancel_event.is_set)
+            if self.cancel_event.is_set():
+                return
+            if image_path:
+                thumbnail, error_message = read_scaled_image(image_path, self.size)
+                if self.cancel_event.is_set():
+                    return
+                if thumbnail is None:
+                    self.signals.error.emit(error_message)
+                    return
+                self.signals.folder_preview_image.emit(
+                    folder_path_str, image_path, thumbnail
+                )
+            else:
+                self.signals.progress.emit(
+                    f"No preview image found for '{folder_name}'"
+                )
+        except Exception as e:
+            self.signals.error.emit(
+                f"Error finding preview for '{folder_name}': {e}"
+            )
+        finally:
+            self.signals.finished.emit(folder_path_str)
+
+
+class ThumbnailSignals(QObject):
+    """Signals emitted by ThumbnailTask, which is not itself a QObject."""
+
+    thumbnails_ready = Signal(list)  # [(image_path, decoded thumbnail QImage)]
+    failed = Signal(str, str)  # image_path, error message
+
+
+class ThumbnailTask(QRunnable):
+    def __init__(self, image_paths, size, signals, cancel_event):
+        """
+        Initialize a thread pool task that decodes a batch of image thumbnails.
+
+        Args:
+            image_paths (list): Paths of the images to decode.
+            size (QSize): Bounding size of the thumbnails.
+            signals (ThumbnailSignals): Shared signal emitter used to report results.
+            cancel_event (threading.Event): Set to skip the images not decoded yet.
+        """
+        super().__init__()
+        self.image_paths = image_paths
+        self.size = size
+        self.signals = signals
+        self.cancel_event = cancel_event
+
+    def run(self):
+        """
+        Decode the thumbnails and report them together.
+
+        The whole batch crosses back to the GUI thread in one queued signal
+        instead of one per image. Only QImages cross threads; converting them
+        to QPixmaps is left to the receiving slot.
+
+        Side effects:
+            - Emits thumbnails_ready with the decoded images, and failed for
+              each image that could not be decoded, unless the task was cancelled
+        """
+        decoded = []
+        for image_path_str in self.image_paths:
+            if self.cancel_event.is_set():
+                return
+            try:
+                image, error_message = read_scaled_image(image_path_str, self.size)
+            except Exception as e:
+                image, error_message = None, f"Error creating thumbnail: {e}"
+            if image is not None:
+                decoded.append((image_path_str, image))
+            else:
+                self.signals.failed.emit(image_path_str, error_message)
+        if decoded and not self.cancel_event.is_set():
+            self.signals.thumbnails_ready.emit(decoded)
 
 
 # --- Worker Thread for Background Tasks ---
@@ -24,7 +389,6 @@ class Worker(QThread):
     finished = Signal(str, bool)
     error = Signal(str)
     image_paths = Signal(list)
-    folder_preview_image = Signal(str, str)  # New signal: folder_path, image_path
     subfolders_found = Signal(list)  # Signal to emit found subdirectories
 
     def __init__(
@@ -41,13 +405,13 @@ class Worker(QThread):
         Initialize a worker thread for background processing tasks.
 
         This worker can handle multiple task types including scanning folders for images,
-        generating folder previews, populating subfolder lists, and merging subfolders.
+        populating subfolder lists, and merging subfolders. Folder previews are
+        made by FolderPreviewTask on a thread pool instead.
 
         Args:
             task_type (str): Type of task to perform. Valid values are:
-                "scan_subfolder_images", "get_folder_preview",
-                "populate_subfolders", "merge_subs"
-            folder_to_scan (str, optional): Path to folder to scan for images or previews.
+                "scan_subfolder_images", "populate_subfolders", "merge_subs"
+            folder_to_scan (str, optional): Path to folder to scan for images.
             source_folder_paths (list, optional): List of folder paths to merge from.
             target_folder_path (str, optional): Target folder path for merge operation.
             root_folder_to_scan (str, optional): Root folder to scan for subfolders.
@@ -59,18 +423,21 @@ class Worker(QThread):
         """
         super().__init__(parent)
         self.task_type = task_type
-        self.folder_to_scan = Path(folder_to_scan) if folder_to_scan else None
+        # Folders are kept as plain strings; the task methods only use os and
+        # os.path functions on them, so no Path objects are built per worker
+        self.folder_to_scan = os.fspath(folder_to_scan) if folder_to_scan else None
         self.root_folder_to_scan = (
-            Path(root_folder_to_scan) if root_folder_to_scan else None
+            os.fspath(root_folder_to_scan) if root_folder_to_scan else None
         )
         self.source_merge_folders = (
-            [Path(p) for p in source_folder_paths] if source_folder_paths else []
+            [os.fspath(p) for p in source_folder_paths] if source_folder_paths else []
         )
         self.target_merge_folder = (
-            Path(target_folder_path) if target_folder_path else None
+            os.fspath(target_folder_path) if target_folder_path else None
         )
-        self._is_running = True
+        self._stop_event = threading.Event()
         self._success = False  # Track task success
+        self._last_progress_time = 0.0
 
     def run(self):
         """
@@ -88,15 +455,11 @@ class Worker(QThread):
             - Sets the internal success flag based on task completion
             - Emits the finished signal when done with task_type and success status
         """
-        self._is_running = True
         self._success = False  # Reset success status
         try:
             if self.task_type == "scan_subfolder_images" and self.folder_to_scan:
                 self._scan_folder_for_images(self.folder_to_scan)
                 self._success = True  # Assume success if no exception
-            elif self.task_type == "get_folder_preview" and self.folder_to_scan:
-                self._get_folder_preview_image(self.folder_to_scan)
-                self._success = True
             elif self.task_type == "populate_subfolders" and self.root_folder_to_scan:
                 self._populate_subfolders(self.root_folder_to_scan)
                 self._success = True
@@ -138,7 +501,6 @@ class Worker(QThread):
             self.error.emit(f"Unexpected error in worker ({self.task_type}): {e}")
             self._success = False
         finally:
-            self._is_running = False
             self.finished.emit(
                 self.task_type, self._success
             )  # Emit task type and success
@@ -147,27 +509,48 @@ class Worker(QThread):
         """
         Request the worker thread to stop execution.
 
-        This method sets a flag that causes task methods to exit their
-        processing loops when checked. It doesn't immediately terminate
-        the thread but allows it to exit cleanly.
+        This method sets a stop event that task methods check once per
+        directory entry, so they exit their loops promptly. It doesn't
+        immediately terminate the thread but allows it to exit cleanly.
 
         Side effects:
-            - Sets internal _is_running flag to False
+            - Sets the internal _stop_event
             - Emits a progress signal indicating cancellation was requested
         """
-        self._is_running = False
+        self._stop_event.set()
         self.progress.emit("Task cancellation requested...")
 
+    def _emit_throttled_progress(self, message):
+        """
+        Emit a progress message unless one was emitted very recently.
+
+        Used for per-item messages in hot loops so that a fast merge does not
+        flood the GUI thread with log updates. Summary messages should be
+        emitted directly so they are never dropped.
+
+        Args:
+            message (str): The progress message to emit
+
+        Side effects:
+            - Emits the progress signal at most once per PROGRESS_MIN_INTERVAL
+        """
+        now = time.monotonic()
+        if now - self._last_progress_time >= PROGRESS_MIN_INTERVAL:
+            self._last_progress_time = now
+            self.progress.emit(message)
+
     def _scan_folder_for_images(self, folder_path):
         """
         Scan a specific folder recursively for image files.
 
         This method searches the specified folder and all its subfolders
         for image files with supported extensions. Found images are emitted
-        in batches using the image_paths signal.
+        in batches using the image_paths signal. A completed scan is
+        remembered, so scanning the same unchanged folder again only stats
+        its directories instead of reading them.
 
         Args:
-            folder_path (Path): Path object representing the folder to scan
+            folder_path (str): The folder to scan
 
         Side effects:
             - Emits progress updates during scanning
@@ -177,37 +560,52 @@ class Worker(QThread):
         Raises:
             Exception: Re-raises any exceptions after reporting them via error signal
         """
-        if not folder_path.is_dir():
+        folder_name = os.path.basename(folder_path)
+        if not os.path.isdir(folder_path):
             self.error.emit(
-                f"Cannot scan: '{folder_path.name}' is not a valid directory."
+                f"Cannot scan: '{folder_name}' is not a valid directory."
             )
             return
 
         try:
-            self.progress.emit(f"Scanning '{folder_path.name}' for images...")
-            count = 0
+            cached_paths = _get_cached_image_listing(folder_path)
+            if cached_paths is not None:
+                # The whole listing is already known, so it crosses to the GUI
+                # thread as a single batch and is inserted with one model update
+                if cached_paths:
+                    self.image_paths.emit(list(cached_paths))
+                self.progress.emit(
+                    f"'{folder_name}' unchanged since last scan. Found {len(cached_paths)} images."
+                )
+                return
+
+            self.progress.emit(f"Scanning '{folder_name}' for images...")
+            found_paths = []
+            dir_mtimes = {}
             paths_to_emit = []
-            # Use rglob to find images recursively within this specific folder
-            for item in folder_path.rglob("*"):
-                if not self._is_running:
+            for entry in _iter_files(folder_path, dir_mtimes=dir_mtimes):
+                if self._stop_event.is_set():
                     self.progress.emit("Scan cancelled.")
                     return
-                if item.is_file() and item.suffix.lower() in SUPPORTED_IMAGE_EXTENSIONS:
-                    # Emit full path
-                    paths_to_emit.append(str(item))
-                    count += 1
-                    if len(paths_to_emit) >= 50:
-                        self.image_paths.emit(paths_to_emit)  # Emit batch
-                        paths_to_emit = []
+                if not _is_image_name(entry.name):
+                    continue
+                image_path = entry.path
+                found_paths.append(image_path)
+                paths_to_emit.append(image_path)
+                if len(paths_to_emit) >= IMAGE_PATH_BATCH_SIZE:
+                    self.image_paths.emit(paths_to_emit)  # Emit batch
+                    paths_to_emit = []
 
             if paths_to_emit:  # Emit any remaining paths
                 self.image_paths.emit(paths_to_emit)
+            _store_image_listing(folder_path, dir_mtimes, found_paths)
+            count = len(found_paths)
 
             self.progress.emit(
-                f"Scan of '{folder_path.name}' complete. Found {count} images."
+                f"Scan of '{folder_name}' complete. Found {count} images."
             )
         except Exception as e:
-            self.error.emit(f"Error during scan of '{folder_path.name}': {e}")
+            self.error.emit(f"Error during scan of '{folder_name}': {e}")
             raise  # Re-raise to indicate failure to the run() method
 
     def _generate_unique_target_path(
@@ -222,8 +620,10 @@ class Worker(QThread):
         Args:
             source_path (Path): Path object representing the source file
             target_folder (Path): Path object representing the target folder
-            existing_names (set, optional): Set of existing filenames in the target folder.
-                Providing this significantly speeds up uniqueness checks.
+            existing_names (set, optional): Case-folded names already present in
+                the target folder. When given, uniqueness is checked against this
+                set only (no filesystem access) and the chosen name is added to
+                it, reserving it for subsequent calls.
 
         Returns:
             Path: A unique Path object for the target file, or None if a unique
@@ -232,19 +632,17 @@ class Worker(QThread):
         Note:
             This method implements a collision resolution strategy where it first
             tries to append incremental numbers, then falls back to a timestamp
-            if needed.
+            if needed. Names are compared case-insensitively when using
+            existing_names so that case-insensitive filesystems cannot silently
+            overwrite a file.
         """
-        name = source_path.name
 
-        def exists(name_to_check, path_to_check):
-            if existing_names is not None and name_to_check in existing_names:
-                # Fast path: known existing name
-                return True
-            # Fallback to filesystem check to handle case-insensitive filesystems
-            return path_to_check.exists()
+        if existing_names is not None:
+            name = self._reserve_target_name(source_path.name, existing_names)
+            return target_folder / name if name is not None else None
 
-        target_path = target_folder / name
-        if not exists(name, target_path):
+        target_path = target_folder / source_path.name
+        if not target_path.exists():
             return target_path  # Path is already unique
 
         # Collision detected, generate a new name
@@ -255,7 +653,7 @@ class Worker(QThread):
         while True:
             new_name = f"{stem}_{counter}{suffix}"
             target_path = target_folder / new_name
-            if not exists(new_name, target_path):
+            if not target_path.exists():
                 break
             counter += 1
             if counter > 1000:  # Safety break
@@ -263,18 +661,90 @@ class Worker(QThread):
                 timestamp = int(time.time() * 1000)
                 new_name = f"{stem}_{timestamp}{suffix}"
                 target_path = target_folder / new_name
-                if exists(new_name, target_path):  # If STILL exists, give up
+                if target_path.exists():  # If STILL exists, give up
                     return None  # Indicate failure to find unique name
                 break  # Exit loop with timestamp name
         return target_path
 
+    def _reserve_target_name(self, name, existing_names, next_counters=None):
+        """
+        Pick a file name that is not yet taken in the target folder and reserve it.
+
+        This is the string-only counterpart of _generate_unique_target_path used
+        by the merge loop, so no Path objects are built per moved file.
+
+        Args:
+            name (str): The source file name
+            existing_names (set): Case-folded names already present in the target
+                folder; the chosen name is added to it
+            next_counters (dict, optional): Remembers, per case-folded name, the
+                counter to try first on its next collision, so many duplicates
+                of one name (e.g. IMG_0001.JPG from several cameras) do not
+                probe _1, _2, ... again every time
+
+        Returns:
+            str: A unique file name, or None if none could be found after 1000
+                 attempts and the timestamp fallback
+        """
+        if name.casefold() not in existing_names:
+            existing_names.add(name.casefold())
+            return name
+
+        stem, suffix = os.path.splitext(name)
+        counter = 1
+        if next_counters is not None:
+            counter = next_counters.get(name.casefold(), 1)
+        while True:
+            new_name = f"{stem}_{counter}{suffix}"
+            if new_name.casefold() not in existing_names:
+                break
+            counter += 1
+            if counter > 1000:  # Safety break
+                timestamp = int(time.time() * 1000)
+                new_name = f"{stem}_{timestamp}{suffix}"
+                if new_name.casefold() in existing_names:
+                    return None
+                break
+        if next_counters is not None:
+            next_counters[name.casefold()] = counter + 1
+        existing_names.add(new_name.casefold())
+        return new_name
+
+    def _move_file(self, source_path, target_path, same_device):
+        """
+        Move a single file to a target path that is known not to exist.
+
+        When source and target are on the same device the move is a single
+        os.replace (a metadata-only rename). Otherwise, or if the rename still
+        reports a cross-device error, shutil.move copies the data instead.
+
+        Args:
+            source_path (str): File to move
+            target_path (str): Unique destination path for the file
+            same_device (bool): Whether the source folder and target folder
+                share a filesystem
+
+        Raises:
+            OSError: If the file cannot be moved
+        """
+        if same_device:
+            try:
+                os.replace(source_path, target_path)
+                return
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+        shutil.move(source_path, target_path)
+
     def _merge_subfolders_to_target(self):
         """
         Move content from source folders into the target folder.
 
         This method processes all source folders, moving their files to the target
-        folder while handling name conflicts. After moving files, it optionally
-        deletes empty source directories.
+        folder while handling name conflicts. Unique target names are chosen
+        sequentially, then the moves themselves run on a thread pool of up to
+        MERGE_MAX_WORKERS threads. After moving files, it optionally deletes
+        empty source directories.
 
         Side effects:
             - Moves files from source folders to target folder
@@ -289,9 +759,8 @@ class Worker(QThread):
             The operation can be cancelled at any point via the stop() method.
         """
         if self.target_merge_folder:
-            self.progress.emit(
-                f"Starting merge into target: {self.target_merge_folder.name}"
-            )
+            target_name = os.path.basename(self.target_merge_folder)
+            self.progress.emit(f"Starting merge into target: {target_name}")
         else:
             self.error.emit("Target merge folder is not set. Aborting merge.")
             return
@@ -300,105 +769,126 @@ class Worker(QThread):
         deleted_source_dirs = 0
         processed_sources = []
 
-        if not self.target_merge_folder.exists():
+        if not os.path.exists(self.target_merge_folder):
             self.error.emit(
-                f"Merge target folder '{self.target_merge_folder.name}' does not exist (should have been created). Aborting merge."
+                f"Merge target folder '{target_name}' does not exist (should have been created). Aborting merge."
             )
             return  # Critical error if target wasn't created
 
-        try:
-            # Pre-calculate existing filenames in target to optimize unique name generation
-            existing_target_names = set(
-                p.name for p in self.target_merge_folder.iterdir()
-            )
-
-            for source_folder in self.source_merge_folders:
-                if not self._is_running:
-                    self.progress.emit(
-                        "Merge cancelled during source folder processing."
+        def record_move(future, source_name):
+            nonlocal moved_count, skipped_count
+            try:
+                future.result()
+                moved_count += 1
+                if moved_count % MERGE_PROGRESS_INTERVAL == 0:
+                    self._emit_throttled_progress(
+                        f"Moved {moved_count} files into {target_name}..."
                     )
-                    return
+            except Exception as move_error:
+                self.error.emit(f"Error moving {source_name}: {move_error}")
+                skipped_count += 1
 
-                if not source_folder.is_dir():
-                    self.error.emit(
-                        f"Source '{source_folder.name}' is not a valid directory. Skipping."
-                    )
-                    continue
-
-                self.progress.emit(f"Processing source: {source_folder.name}...")
-                items_to_move = list(source_folder.rglob("*"))
-                processed_items_in_source = 0
-
-                for item_path in items_to_move:
-                    if not self._is_running:
-                        self.progress.emit("Merge cancelled during file processing.")
+        try:
+            # Index existing filenames once so unique names are picked in memory
+            existing_target_names = {
+                name.casefold() for name in os.listdir(self.target_merge_folder)
+            }
+            next_counters = {}
+            target_device = os.stat(self.target_merge_folder).st_dev
+            target_dir = self.target_merge_folder
+
+            with ThreadPoolExecutor(max_workers=MERGE_MAX_WORKERS) as executor:
+                for source_folder in self.source_merge_folders:
+                    if self._stop_event.is_set():
+                        self.progress.emit(
+                            "Merge cancelled during source folder processing."
+                        )
                         return
 
-                    if item_path.is_file():  # Only move files
-                        source_path = item_path
-                        target_path = self._generate_unique_target_path(
-                            source_path,
-                            self.target_merge_folder,
-                            existing_names=existing_target_names,
+                    source_name = os.path.basename(source_folder)
+                    if not os.path.isdir(source_folder):
+                        self.error.emit(
+                            f"Source '{source_name}' is not a valid directory. Skipping."
                         )
+                        continue
 
-                        if target_path is None:
-                            self.error.emit(
-                                f"Could not generate unique name for '{source_path.name}' in target. Skipping."
-                            )
-                            skipped_count += 1
-                            continue  # Skip this file
+                    self.progress.emit(f"Processing source: {source_name}...")
+                    same_device = os.stat(source_folder).st_dev == target_device
+
+                    # Target names are reserved here, in walk order; only the moves
+                    # themselves run in parallel. Files are streamed from the walk so
+                    # the first moves start before the whole tree has been read.
+                    pending_moves = {}
+                    # Directories seen by the walk, reused for the empty-dir sweep
+                    source_dirs = []
+                    for entry in _iter_files(source_folder, source_dirs):
+                        if self._stop_event.is_set():
+                            for pending in pending_moves:
+                                pending.cancel()
+                            self.progress.emit("Merge cancelled during file processing.")
+                            return
 
-                        try:
-                            shutil.move(str(source_path), str(target_path))
-                            existing_target_names.add(target_path.name)
-                            self.progress.emit(
-                                f"Moved: {source_path.name} -> {target_path.name} (into {self.target_merge_folder.name})"
-                            )
-                            moved_count += 1
-                        except Exception as move_error:
+                        # Plain strings from scandir; no Path objects per file
+                        reserved_name = self._reserve_target_name(
+                            entry.name, existing_target_names, next_counters
+                        )
+                        if reserved_name is None:
                             self.error.emit(
-                                f"Error moving {source_path.name}: {move_error}"
+                                f"Could not generate unique name for '{entry.name}' in target. Skipping."
                             )
                             skipped_count += 1
+                            continue  # Skip this file
 
-                    processed_items_in_source += 1
+                        future = executor.submit(
+                            self._move_file,
+                            entry.path,
+                            os.path.join(target_dir, reserved_name),
+                            same_device,
+                        )
+                        pending_moves[future] = entry.name
+                        if len(pending_moves) >= MERGE_MAX_PENDING_MOVES:
+                            done, _ = wait(pending_moves, return_when=FIRST_COMPLETED)
+                            for future in done:
+                                record_move(future, pending_moves.pop(future))
+
+                    for future in as_completed(pending_moves):
+                        if self._stop_event.is_set():
+                            for pending in pending_moves:
+                                pending.cancel()
+                            self.progress.emit("Merge cancelled during file processing.")
+                            return
+                        record_move(future, pending_moves[future])
 
-                processed_sources.append(source_folder)
+                    processed_sources.append((source_folder, source_dirs))
 
             # --- Optional Deletion of Empty Source Folders ---
             self.progress.emit("Checking source folders for deletion...")
-            for source_folder in processed_sources:
-                if not self._is_running:
+            for source_folder, source_dirs in processed_sources:
+                if self._stop_event.is_set():
                     break
                 try:
-                    empty_dirs_in_source = []
-                    for root, dirs, files in os.walk(str(source_folder), topdown=False):
-                        if not self._is_running:
-                            break
-                        root_path = Path(root)
-                        if not dirs and not files:
-                            empty_dirs_in_source.append(root_path)
-                    if not self._is_running:
-                        break
-
-                    for dir_to_delete in empty_dirs_in_source:
-                        if not self._is_running:
+                    # The merge walk already listed every directory, so there is
+                    # no second walk: visit children before parents and rmdir as
+                    # we go, so a directory whose subdirectories were just removed
+                    # is deleted in the same pass. Directories still holding files
+                    # (e.g. skipped ones) fail with ENOTEMPTY and are kept.
+                    for root in reversed(source_dirs):
+                        if self._stop_event.is_set():
                             break
                         try:
-                            dir_to_delete.rmdir()
-                            self.progress.emit(
-                                f"Deleted empty directory: {dir_to_delete}"
-                            )
-                            if dir_to_delete == source_folder:
-                                deleted_source_dirs += 1
+                            os.rmdir(root)
                         except OSError as rmdir_error:
-                            self.progress.emit(
-                                f"Could not delete dir {dir_to_delete.name}: {rmdir_error}"
-                            )
+                            if rmdir_error.errno not in (errno.ENOTEMPTY, errno.EEXIST):
+                                self.progress.emit(
+                                    f"Could not delete dir {os.path.basename(root)}: {rmdir_error}"
+                                )
+                            continue
+                        self._emit_throttled_progress(f"Deleted empty directory: {root}")
+                        if root == source_folder:
+                            deleted_source_dirs += 1
                 except Exception as del_check_err:
                     self.error.emit(
-                        f"Error during deletion check for {source_folder.name}: {del_check_err}"
+                        f"Error during deletion check for {os.path.basename(source_folder)}: {del_check_err}"
                     )
             # -----------------------------------------------------
 
@@ -417,79 +907,6 @@ class Worker(QThread):
             self.error.emit(f"Error during merging process: {e}")
             self._success = False
 
-    def _get_folder_preview_image(self, folder_path):
-        """
-        Find the first suitable image in a folder to use as a preview thumbnail.
-
-        This method searches for image files in the specified folder and up to
-        2 levels of subfolders. It returns the first valid image found that can
-        be accessed and has a non-zero size.
-
-        The search follows this pattern:
-        1. Look for images in the immediate folder
-        2. If none found, search one level of subfolders
-        3. If still none found, search two levels of subfolders
-
-        Args:
-            folder_path (Path): Path object representing the folder to search for preview images
-
-        Side effects:
-            - Emits folder_preview_image signal with the folder path and the found image path
-            - Emits progress updates for certain conditions
-            - Emits error signal if the folder is invalid or errors occur
-
-        Note:
-            This method only processes files with extensions defined in SUPPORTED_IMAGE_EXTENSIONS.
-            It skips files that cannot be accessed due to permissions or other I/O errors.
-        """
-        if not folder_path.is_dir():
-            self.error.emit(
-                f"Cannot scan: '{folder_path.name}' is not a valid directory."
-            )
-            return
-
-        try:
-            for item in folder_path.glob("*"):
-                if not self._is_running:
-                    return
-                if item.is_file() and item.suffix.lower() in SUPPORTED_IMAGE_EXTENSIONS:
-                    try:
-                        if os.path.getsize(str(item)) > 0:
-                            self.folder_preview_image.emit(str(folder_path), str(item))
-                            return
-                    except (OSError, PermissionError) as e:
-                        self.progress.emit(
-                            f"Skipping inaccessible image: {item.name} - {e}"
-                        )
-                        continue
-
-            max_depth = 2
-            for depth in range(1, max_depth + 1):
-                pattern = "/".join(["*"] * depth)
-                for item in folder_path.glob(pattern):
-                    if not self._is_running:
-                        return
-                    if (
-                        item.is_file()
-                        and item.suffix.lower() in SUPPORTED_IMAGE_EXTENSIONS
-                    ):
-                        try:
-                            if os.path.getsize(str(item)) > 0:
-                                self.folder_preview_image.emit(
-                                    str(folder_path), str(item)
-                                )
-                                return
-                        except (OSError, PermissionError) as e:
-                            self.progress.emit(
-                                f"Skipping inaccessible image: {item.name} - {e}"
-                            )
-                            continue
-
-            self.progress.emit(f"No preview image found for '{folder_path.name}'")
-
-        except Exception as e:
-            self.error.emit(f"Error finding preview for '{folder_path.name}': {e}")
-
     def _populate_subfolders(self, root_folder_path):
         """
         Scan the root folder for immediate subdirectories.
@@ -499,37 +916,41 @@ class Worker(QThread):
         It does not recursively search for subdirectories beyond the first level.
 
         Args:
-            root_folder_path (Path): Path object representing the root folder to scan
+            root_folder_path (str): The root folder to scan
 
         Side effects:
             - Emits progress updates at start and completion
-            - Emits subfolders_found signal with list of Path objects
+            - Emits subfolders_found signal with a list of folder path strings
             - Emits error signal if the folder is invalid or errors occur
 
         Raises:
             Exception: Re-raises any exceptions after reporting them via error signal
         """
-        if not root_folder_path.is_dir():
+        root_name = os.path.basename(root_folder_path)
+        if not os.path.isdir(root_folder_path):
             self.error.emit(
-                f"Cannot populate: '{root_folder_path.name}' is not a valid directory."
+                f"Cannot populate: '{root_name}' is not a valid directory."
             )
             return
 
         try:
-            self.progress.emit(f"Scanning '{root_folder_path.name}' for subfolders...")
+            self.progress.emit(f"Scanning '{root_name}' for subfolders...")
             subdirs = []
-            for item in root_folder_path.iterdir():
-                if not self._is_running:
-                    self.progress.emit("Subfolder scan cancelled.")
-                    return
-                if item.is_dir():
-                    subdirs.append(item)
+            # DirEntry.is_dir() uses the type cached by scandir, avoiding a stat
+            # per entry; paths are sent as plain strings, with no Path per folder
+            with os.scandir(root_folder_path) as it:
+                for entry in it:
+                    if self._stop_event.is_set():
+                        self.progress.emit("Subfolder scan cancelled.")
+                        return
+                    if entry.is_dir():
+                        subdirs.append(entry.path)
 
-            if self._is_running:
+            if not self._stop_event.is_set():
                 self.subfolders_found.emit(subdirs)
                 self.progress.emit(f"Found {len(subdirs)} subfolders.")
         except Exception as e:
             self.error.emit(
-                f"Error during subfolder scan of '{root_folder_path.name}': {e}"
+                f"Error during subfolder scan of '{root_name}': {e}"
             )
             raise
@@ -0,0 +1,124 @@
+import os
+
+from MergePicFolders.cache import PreviewCache
+
+
+def make_folder_with_image(tmp_path, name):
+    folder = tmp_path / name
+    folder.mkdir()
+    image = folder / "a.jpg"
+    image.write_bytes(b"x")
+    return folder, image
+
+
+def test_preview_cache_round_trip(tmp_path):
+    folder, image = make_folder_with_image(tmp_path, "one")
+    cache = PreviewCache(tmp_path / "db" / "thumbs.sqlite")
+    assert cache.available
+
+    cache.store(str(folder), str(image), b"thumb")
+    cache.close()
+
+    reopened = PreviewCache(tmp_path / "db" / "thumbs.sqlite")
+    assert reopened.lookup_many([str(folder), str(tmp_path / "missing")]) == {
+        str(folder): (str(image), os.stat(image).st_mtime_ns, b"thumb")
+    }
+    reopened.close()
+
+
+def test_preview_cache_ignores_changed_folder_or_image(tmp_path):
+    changed, changed_image = make_folder_with_image(tmp_path, "changed")
+    emptied, emptied_image = make_folder_with_image(tmp_path, "emptied")
+    edited, edited_image = make_folder_with_image(tmp_path, "edited")
+    cache = PreviewCache(tmp_path / "thumbs.sqlite")
+    cache.store(str(changed), str(changed_image))
+    cache.store(str(emptied), str(emptied_image))
+    cache.store(str(edited), str(edited_image))
+
+    changed_mtime = os.path.getmtime(changed)
+    os.utime(changed, (changed_mtime + 10, changed_mtime + 10))
+    # Keep the folder mtime unchanged so only the missing image invalidates it
+    emptied_mtime = os.path.getmtime(emptied)
+    emptied_image.unlink()
+    os.utime(emptied, (emptied_mtime, emptied_mtime))
+    # Editing the image in place leaves the folder mtime alone
+    image_mtime = os.path.getmtime(edited_image)
+    os.utime(edited_image, (image_mtime + 10, image_mtime + 10))
+
+    assert cache.lookup_many([str(changed), str(emptied), str(edited)]) == {}
+    cache.close()
+
+
+def test_preview_cache_invalidate_removes_folder_and_children(tmp_path):
+    parent, parent_image = make_folder_with_image(tmp_path, "par_ent")
+    child, child_image = make_folder_with_image(parent, "child")
+    sibling, sibling_image = make_folder_with_image(tmp_path, "parXent")
+    cache = PreviewCache(tmp_path / "thumbs.sqlite")
+    for folder, image in (
+        (parent, parent_image),
+        (child, child_image),
+        (sibling, sibling_image),
+    ):
+        cache.store(str(folder), str(image))
+
+    cache.invalidate(str(parent))
+
+    assert cache.lookup_many([str(parent), str(child), str(sibling)]) == {
+        str(sibling): (str(sibling_image), os.stat(sibling_image).st_mtime_ns, None)
+    }
+    cache.close()
+
+
+def test_preview_cache_evicts_least_recently_used_thumbnails(tmp_path):
+    folders = [make_folder_with_image(tmp_path, name) for name in ("a", "b", "c")]
+    cache = PreviewCache(tmp_path / "thumbs.sqlite", bytes_limit=250)
+    (a, a_image), (b, b_image), (c, c_image) = folders
+    cache.store(str(a), str(a_image), b"x" * 100)
+    cache.store(str(b), str(b_image), b"x" * 100)
+    # Touch "a" so "b" becomes the least recently used row
+    assert str(a) in cache.lookup_many([str(a)])
+
+    cache.store(str(c), str(c_image), b"x" * 100)
+
+    assert set(cache.lookup_many([str(a), str(b), str(c)])) == {str(a), str(c)}
+    cache.close()
+
+
+def test_preview_cache_counts_replaced_thumbnails_once(tmp_path):
+    (a, a_image), (b, b_image) = (
+        make_folder_with_image(tmp_path, name) for name in ("a", "b")
+    )
+    cache = PreviewCache(tmp_path / "thumbs.sqlite", bytes_limit=250)
+    cache.store(str(a), str(a_image), b"x" * 100)
+    # Replacing a row must not add its old thumbnail to the running total
+    cache.store(str(a), str(a_image), b"x" * 100)
+    cache.store(str(b), str(b_image), b"x" * 100)
+    cache.close()
+
+    reopened = PreviewCache(tmp_path / "thumbs.sqlite", bytes_limit=250)
+    assert set(reopened.lookup_many([str(a), str(b)])) == {str(a), str(b)}
+    reopened.invalidate(str(a))
+    c, c_image = make_folder_with_image(tmp_path, "c")
+    reopened.store(str(c), str(c_image), b"x" * 100)
+    assert set(reopened.lookup_many([str(b), str(c)])) == {str(b), str(c)}
+    reopened.close()
+
+
+def test_preview_cache_writes_usage_lazily(tmp_path):
+    (a, a_image), (b, b_image), (c, c_image) = (
+        make_folder_with_image(tmp_path, name) for name in ("a", "b", "c")
+    )
+    cache = PreviewCache(tmp_path / "thumbs.sqlite", bytes_limit=250)
+    cache.store(str(a), str(a_image), b"x" * 100)
+    cache.store(str(b), str(b_image), b"x" * 100)
+    changes = cache._conn.total_changes
+
+    assert str(a) in cache.lookup_many([str(a)])
+    assert cache._conn.total_changes == changes
+    cache.close()
+
+    # The use of "a" was written on close, so "b" is evicted first
+    reopened = PreviewCache(tmp_path / "thumbs.sqlite", bytes_limit=250)
+    reopened.store(str(c), str(c_image), b"x" * 100)
+    assert set(reopened.lookup_many([str(a), str(b), str(c)])) == {str(a), str(c)}
+    reopened.close()
@@ -0,0 +1,35 @@
+from PySide6.QtCore import Qt
+
+from MergePicFolders.models import ImageListModel
+
+
+def test_image_list_model_appends_batches_of_paths():
+    model = ImageListModel()
+    model.append_paths(["/a/one.jpg", "/a/two.png"])
+    model.append_paths(["/a/three.gif"])
+
+    assert model.rowCount() == 3
+    assert model.data(model.index(2)) == "three.gif"
+    assert model.data(model.index(1), Qt.ItemDataRole.UserRole) == "/a/two.png"
+    assert model.contains("/a/one.jpg")
+
+
+def test_image_list_model_clear_forgets_paths():
+    model = ImageListModel()
+    model.append_paths(["/a/one.jpg"])
+
+    model.clear()
+
+    assert model.rowCount() == 0
+    assert not model.contains("/a/one.jpg")
+    assert model.set_thumbnail("/a/one.jpg", "key") is False
+
+
+def test_image_list_model_set_thumbnail_signals_row_change():
+    model = ImageListModel()
+    model.append_paths(["/a/one.jpg", "/a/two.png"])
+    changed_rows = []
+    model.dataChanged.connect(lambda top, bottom, roles: changed_rows.append(top.row()))
+
+    assert model.set_thumbnail("/a/two.png", "key") is True
+    assert changed_rows == [1]
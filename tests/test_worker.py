@@ -1,7 +1,13 @@
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
-from MergePicFolders.worker import Worker
+from MergePicFolders.worker import (
+    Worker,
+    _find_preview_image,
+    _is_image_name,
+    _iter_files,
+    read_scaled_image,
+)
 
 def test_generate_unique_target_path_no_conflict():
     worker = Worker("test_task")
@@ -69,3 +75,297 @@ def test_generate_unique_target_path_safety_break_timestamp_failure(mock_time):
         result = worker._generate_unique_target_path(source_path, target_folder)
 
     assert result is None
+
+def test_scan_finds_images_in_nested_folders(tmp_path):
+    (tmp_path / "a.JPG").touch()
+    (tmp_path / "notes.txt").touch()
+    nested = tmp_path / "sub" / "deeper"
+    nested.mkdir(parents=True)
+    (nested / "b.png").touch()
+    (nested / "png").touch()
+
+    worker = Worker("scan_subfolder_images")
+    found = []
+    worker.image_paths.connect(found.extend)
+    worker._scan_folder_for_images(str(tmp_path))
+    found.sort()
+
+    assert found == sorted([str(tmp_path / "a.JPG"), str(nested / "b.png")])
+
+def test_iter_files_records_visited_dirs_parents_first(tmp_path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "a" / "keep.txt").touch()
+    (tmp_path / "c").mkdir()
+
+    visited = []
+    files = [entry.name for entry in _iter_files(tmp_path, visited)]
+
+    assert files == ["keep.txt"]
+    assert sorted(visited) == sorted(
+        [str(tmp_path), str(tmp_path / "a"), str(tmp_path / "a" / "b"), str(tmp_path / "c")]
+    )
+    assert visited[0] == str(tmp_path)
+    assert visited.index(str(tmp_path / "a")) < visited.index(str(tmp_path / "a" / "b"))
+
+def test_merge_subfolders_to_target_moves_files_and_renames_conflicts(tmp_path):
+    source_a = tmp_path / "a"
+    source_b = tmp_path / "b"
+    (source_a / "nested").mkdir(parents=True)
+    source_b.mkdir()
+    (source_a / "image.png").write_bytes(b"a")
+    (source_a / "nested" / "other.jpg").write_bytes(b"nested")
+    (source_b / "image.png").write_bytes(b"b")
+    target = tmp_path / "a_merged"
+    target.mkdir()
+
+    worker = Worker(
+        "merge_subs",
+        source_folder_paths=[str(source_a), str(source_b)],
+        target_folder_path=str(target),
+    )
+    worker._merge_subfolders_to_target()
+
+    assert sorted(p.name for p in target.iterdir()) == [
+        "image.png",
+        "image_1.png",
+        "other.jpg",
+    ]
+    assert (target / "image.png").read_bytes() == b"a"
+    assert (target / "image_1.png").read_bytes() == b"b"
+    assert not source_a.exists()
+    assert not source_b.exists()
+    assert worker._success
+
+def test_merge_progress_names_the_target_folder(tmp_path):
+    source = tmp_path / "a"
+    source.mkdir()
+    for index in range(150):
+        (source / f"f{index}.jpg").write_bytes(b"x")
+    target = tmp_path / "a_merged"
+    target.mkdir()
+
+    worker = Worker(
+        "merge_subs", source_folder_paths=[str(source)], target_folder_path=str(target)
+    )
+    messages = []
+    worker.progress.connect(messages.append)
+    worker._merge_subfolders_to_target()
+
+    assert "Moved 100 files into a_merged..." in messages
+
+def test_merge_keeps_source_dirs_that_still_hold_files(tmp_path):
+    source = tmp_path / "a"
+    (source / "empty" / "deeper").mkdir(parents=True)
+    (source / "kept").mkdir()
+    (source / "image.png").write_bytes(b"a")
+    (source / "kept" / "skip.txt").write_bytes(b"k")
+    target = tmp_path / "a_merged"
+    target.mkdir()
+
+    worker = Worker(
+        "merge_subs", source_folder_paths=[str(source)], target_folder_path=str(target)
+    )
+    # Simulate a file that cannot be given a name in the target
+    worker._reserve_target_name = lambda name, *args: (
+        None if name == "skip.txt" else name
+    )
+    worker._merge_subfolders_to_target()
+
+    assert (target / "image.png").exists()
+    assert (source / "kept" / "skip.txt").exists()
+    assert not (source / "empty").exists()
+
+def test_generate_unique_target_path_uses_existing_names_without_stat():
+    worker = Worker("test_task")
+    source_path = Path("source/Image.png")
+    target_folder = Path("target")
+    existing_names = {"image.png", "image_1.png"}
+
+    with patch("pathlib.Path.exists", side_effect=AssertionError("no stat expected")):
+        first = worker._generate_unique_target_path(
+            source_path, target_folder, existing_names
+        )
+        second = worker._generate_unique_target_path(
+            source_path, target_folder, existing_names
+        )
+
+    assert first == target_folder / "Image_2.png"
+    assert second == target_folder / "Image_3.png"
+    assert {"image_2.png", "image_3.png"} <= existing_names
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("photo.JPG", True),
+        ("archive.tar.webp", True),
+        ("notes.txt", False),
+        ("png", False),
+        (".png", False),
+        ("trailing.", False),
+    ],
+)
+def test_is_image_name(name, expected):
+    assert _is_image_name(name) is expected
+
+def test_find_preview_image_prefers_shallowest_image(tmp_path):
+    deep = tmp_path / "a" / "b"
+    deep.mkdir(parents=True)
+    (deep / "deep.png").write_bytes(b"x")
+    (tmp_path / "a" / "shallow.jpg").write_bytes(b"x")
+    (tmp_path / "a" / "notes.txt").write_bytes(b"x")
+
+    found = _find_preview_image(tmp_path, lambda: False)
+
+    assert found == str(tmp_path / "a" / "shallow.jpg")
+
+
+def test_find_preview_image_respects_max_depth(tmp_path):
+    deep = tmp_path / "a" / "b" / "c"
+    deep.mkdir(parents=True)
+    (deep / "deep.png").write_bytes(b"x")
+
+    assert _find_preview_image(tmp_path, lambda: False) is None
+    assert _find_preview_image(tmp_path, lambda: False, max_depth=3) == str(
+        deep / "deep.png"
+    )
+
+def test_stopped_worker_does_not_report_subfolders(tmp_path):
+    (tmp_path / "sub").mkdir()
+    worker = Worker("populate_subfolders", root_folder_to_scan=str(tmp_path))
+    found = []
+    worker.subfolders_found.connect(found.append)
+
+    worker.stop()
+    worker.run()
+
+    assert found == []
+
+def test_reserve_target_name_is_case_insensitive_and_reserves():
+    worker = Worker("test_task")
+    existing = {"image.png", "image_1.png"}
+
+    assert worker._reserve_target_name("IMAGE.png", existing) == "IMAGE_2.png"
+    assert worker._reserve_target_name("other.jpg", existing) == "other.jpg"
+    assert worker._reserve_target_name("Other.JPG", existing) == "Other_1.JPG"
+    assert {"image_2.png", "other.jpg", "other_1.jpg"} <= existing
+
+def test_reserve_target_name_resumes_counter_for_repeated_names():
+    worker = Worker("test_task")
+    existing = {"img.jpg", "img_1.jpg", "img_2.jpg"}
+    next_counters = {}
+
+    assert worker._reserve_target_name("IMG.jpg", existing, next_counters) == "IMG_3.jpg"
+    existing.discard("img_1.jpg")
+    # The freed lower counter is not probed again for the same name
+    assert worker._reserve_target_name("img.jpg", existing, next_counters) == "img_4.jpg"
+    assert next_counters == {"img.jpg": 5}
+
+def test_read_scaled_image_keeps_aspect_ratio(tmp_path):
+    from PySide6.QtCore import QSize
+    from PySide6.QtGui import QImage
+
+    source = QImage(400, 200, QImage.Format.Format_RGB32)
+    source.fill(0)
+    image_path = str(tmp_path / "wide.png")
+    assert source.save(image_path)
+
+    image, error = read_scaled_image(image_path, QSize(100, 100))
+    assert error is None
+    assert (image.width(), image.height()) == (100, 50)
+
+    (tmp_path / "broken.png").write_bytes(b"not an image")
+    image, error = read_scaled_image(str(tmp_path / "broken.png"), QSize(100, 100))
+    assert image is None
+    assert "broken.png" in error
+
+def test_read_scaled_image_does_not_upscale_small_images(tmp_path):
+    from PySide6.QtCore import QSize
+    from PySide6.QtGui import QImage
+
+    source = QImage(40, 30, QImage.Format.Format_RGB32)
+    source.fill(0)
+    image_path = str(tmp_path / "small.png")
+    assert source.save(image_path)
+
+    image, error = read_scaled_image(image_path, QSize(100, 100))
+    assert error is None
+    assert (image.width(), image.height()) == (40, 30)
+
+def test_folder_preview_task_emits_decoded_thumbnail(tmp_path):
+    import threading
+    from PySide6.QtCore import QSize
+    from PySide6.QtGui import QImage
+    from MergePicFolders.worker import FolderPreviewTask, PreviewSignals
+
+    source = QImage(300, 150, QImage.Format.Format_RGB32)
+    source.fill(0)
+    image_path = str(tmp_path / "wide.png")
+    assert source.save(image_path)
+
+    signals = PreviewSignals()
+    previews = []
+    signals.folder_preview_image.connect(
+        lambda folder, path, image: previews.append((folder, path, image.size()))
+    )
+    FolderPreviewTask(str(tmp_path), QSize(64, 64), signals, threading.Event()).run()
+
+    assert previews == [(str(tmp_path), image_path, QSize(64, 32))]
+
+def test_scan_reuses_listing_until_a_directory_changes(tmp_path):
+    import os
+    nested = tmp_path / "sub"
+    nested.mkdir()
+    (tmp_path / "a.jpg").touch()
+    (nested / "b.png").touch()
+    # Listings of just-modified directories are not kept, so age the tree
+    for folder in (tmp_path, nested):
+        stat = os.stat(folder)
+        os.utime(folder, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**10))
+
+    def scan():
+        worker = Worker("scan_subfolder_images")
+        found = []
+        worker.image_paths.connect(found.extend)
+        with patch("MergePicFolders.worker.os.scandir", wraps=os.scandir) as scandir:
+            worker._scan_folder_for_images(str(tmp_path))
+        return sorted(found), scandir.call_count
+
+    first, first_reads = scan()
+    assert first == sorted([str(tmp_path / "a.jpg"), str(nested / "b.png")])
+    assert first_reads == 2
+
+    assert scan() == (first, 0)
+
+    (nested / "c.gif").touch()
+    rescanned, reads = scan()
+    assert str(nested / "c.gif") in rescanned
+    assert reads == 2
+    # "sub" was modified just now, so the new listing was not kept
+    assert scan() == (rescanned, 2)
+
+def test_thumbnail_task_reports_batch_and_failures(tmp_path):
+    import threading
+    from PySide6.QtCore import QSize
+    from PySide6.QtGui import QImage
+    from MergePicFolders.worker import ThumbnailSignals, ThumbnailTask
+
+    source = QImage(200, 100, QImage.Format.Format_RGB32)
+    source.fill(0)
+    good = [str(tmp_path / "a.png"), str(tmp_path / "b.png")]
+    for path in good:
+        assert source.save(path)
+    broken = tmp_path / "broken.png"
+    broken.write_bytes(b"not an image")
+
+    signals = ThumbnailSignals()
+    batches, failures = [], []
+    signals.thumbnails_ready.connect(
+        lambda batch: batches.append([(path, image.size()) for path, image in batch])
+    )
+    signals.failed.connect(lambda path, message: failures.append(path))
+    ThumbnailTask(
+        [good[0], str(broken), good[1]], QSize(50, 50), signals, threading.Event()
+    ).run()
+
+    assert batches == [[(good[0], QSize(50, 25)), (good[1], QSize(50, 25))]]
+    assert failures == [str(broken)]